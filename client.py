@@ -1,46 +1,127 @@
-import json
-from dataclasses import dataclass
-from urllib import request
-from urllib.error import HTTPError, URLError
+import asyncio
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from threading import Lock
+
+import httpx
+import msgpack
+import orjson
+
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
 
 
 class HostClientError(Exception):
     pass
 
 
+def _encode(payload, content_type: str) -> bytes:
+    if content_type == MSGPACK_MEDIA_TYPE:
+        return msgpack.packb(payload, use_bin_type=True)
+    return orjson.dumps(payload)
+
+
+def _decode(body: bytes, content_type: str):
+    if content_type.startswith(MSGPACK_MEDIA_TYPE):
+        return msgpack.unpackb(body, raw=False)
+    return orjson.loads(body)
+
+
+def _error_detail(resp: httpx.Response) -> str:
+    if resp.headers.get("Content-Type", "").startswith(MSGPACK_MEDIA_TYPE):
+        return orjson.dumps(msgpack.unpackb(resp.content, raw=False)).decode("utf-8")
+    return resp.text or f"HTTP {resp.status_code}"
+
+
+def _read_response(resp: httpx.Response):
+    if resp.is_error:
+        raise HostClientError(_error_detail(resp))
+    body = resp.content
+    if not body:
+        return None
+    return _decode(body, resp.headers.get("Content-Type", JSON_MEDIA_TYPE))
+
+
+def _pool_limits(max_connections: int) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    )
+
+
 @dataclass
 class OnnxHostClient:
     base_url: str = "http://127.0.0.1:8000"
+    timeout: float = 30.0
+    max_connections: int = 10
+    _http: httpx.Client = field(init=False, repr=False)
+    _inflight: dict[tuple[str, str], Future] = field(init=False, repr=False, default_factory=dict)
+    _inflight_lock: Lock = field(init=False, repr=False, default_factory=Lock)
+
+    def __post_init__(self):
+        # One pooled client per instance so repeated calls reuse keep-alive connections.
+        self._http = httpx.Client(timeout=self.timeout, limits=_pool_limits(self.max_connections))
+
+    def close(self) -> None:
+        self._http.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _url(self, path: str) -> str:
         return f"{self.base_url}{path}"
 
-    def _get(self, path: str):
-        req = request.Request(self._url(path), method="GET")
-        return self._send(req)
-
-    def _post(self, path: str, payload: dict | None = None):
-        data = None
-        if payload is not None:
-            data = json.dumps(payload).encode("utf-8")
-        req = request.Request(
-            self._url(path),
-            data=data,
-            method="POST",
-            headers={"Content-Type": "application/json"},
+    def _get(self, path: str, content_type: str = JSON_MEDIA_TYPE):
+        # Concurrent identical GETs (e.g. several threads polling /status) share
+        # one round-trip; every waiter receives the same decoded object.
+        key = (path, content_type)
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = Future()
+                self._inflight[key] = pending
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return pending.result()
+
+        try:
+            result = self._send("GET", path, headers={"Accept": content_type})
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _post(self, path: str, payload: dict | None = None, content_type: str = JSON_MEDIA_TYPE):
+        if payload is None:
+            return self._post_empty(path, content_type)
+        return self._send(
+            "POST",
+            path,
+            content=_encode(payload, content_type),
+            headers={"Content-Type": content_type, "Accept": content_type},
         )
-        return self._send(req)
 
-    def _send(self, req: request.Request):
+    def _post_empty(self, path: str, content_type: str = JSON_MEDIA_TYPE):
+        # No body, so no Content-Type; httpx sends Content-Length: 0.
+        return self._send("POST", path, headers={"Accept": content_type})
+
+    def _send(self, method: str, path: str, *, content: bytes | None = None, headers: dict[str, str]):
         try:
-            with request.urlopen(req, timeout=30) as resp:
-                body = resp.read().decode("utf-8")
-                return json.loads(body) if body else None
-        except HTTPError as e:
-            detail = e.read().decode("utf-8") if e.fp else str(e)
-            raise HostClientError(detail) from e
-        except URLError as e:
+            resp = self._http.request(method, self._url(path), content=content, headers=headers)
+        except httpx.HTTPError as e:
             raise HostClientError(str(e)) from e
+        return _read_response(resp)
 
     def models(self):
         return self._get("/models")
@@ -69,10 +150,124 @@ class OnnxHostClient:
         return self._post(f"/models/{model_id}/active", payload)
 
     def smoke(self, model_id: str):
-        return self._post(f"/models/{model_id}/smoke")
+        return self._post_empty(f"/models/{model_id}/smoke")
+
+    def predict(self, model_id: str, inputs: dict, content_type: str = JSON_MEDIA_TYPE):
+        return self._post(f"/predict/{model_id}", inputs, content_type=content_type)
 
-    def predict(self, model_id: str, inputs: dict):
-        return self._post(f"/predict/{model_id}", inputs)
+    def audio_state(self, content_type: str = JSON_MEDIA_TYPE):
+        return self._get("/audio/state", content_type=content_type)
 
     def status(self):
         return self._get("/status")
+
+
+@dataclass
+class AsyncOnnxHostClient:
+    """
+    asyncio counterpart of OnnxHostClient, for issuing calls concurrently:
+
+        async with AsyncOnnxHostClient() as client:
+            results = await asyncio.gather(*(client.predict(m, x) for m in model_ids))
+    """
+
+    base_url: str = "http://127.0.0.1:8000"
+    timeout: float = 30.0
+    max_connections: int = 10
+    _http: httpx.AsyncClient = field(init=False, repr=False)
+    _inflight: dict[tuple[str, str], asyncio.Task] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self):
+        self._http = httpx.AsyncClient(timeout=self.timeout, limits=_pool_limits(self.max_connections))
+
+    async def close(self) -> None:
+        await self._http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    async def _get(self, path: str, content_type: str = JSON_MEDIA_TYPE):
+        # Concurrent identical GETs share one round-trip, as in OnnxHostClient.
+        # The request runs as its own task and every caller (the first one
+        # included) waits on it through shield(), so one caller timing out or
+        # being cancelled does not cancel the others.
+        key = (path, content_type)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._send("GET", path, headers={"Accept": content_type})
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_get(key, done))
+        return await asyncio.shield(task)
+
+    def _finish_get(self, key: tuple[str, str], task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every waiter gave up.
+            task.exception()
+
+    async def _post(self, path: str, payload: dict | None = None, content_type: str = JSON_MEDIA_TYPE):
+        if payload is None:
+            return await self._post_empty(path, content_type)
+        return await self._send(
+            "POST",
+            path,
+            content=_encode(payload, content_type),
+            headers={"Content-Type": content_type, "Accept": content_type},
+        )
+
+    async def _post_empty(self, path: str, content_type: str = JSON_MEDIA_TYPE):
+        return await self._send("POST", path, headers={"Accept": content_type})
+
+    async def _send(self, method: str, path: str, *, content: bytes | None = None, headers: dict[str, str]):
+        try:
+            resp = await self._http.request(method, self._url(path), content=content, headers=headers)
+        except httpx.HTTPError as e:
+            raise HostClientError(str(e)) from e
+        return _read_response(resp)
+
+    async def models(self):
+        return await self._get("/models")
+
+    async def load(self, model_id: str, variant: str | None = None):
+        payload = {"id": model_id}
+        if variant:
+            payload["variant"] = variant
+        return await self._post("/models/load", payload)
+
+    async def unload(self, model_id: str):
+        return await self._post("/models/unload", {"id": model_id})
+
+    async def inputs(self, model_id: str):
+        return await self._get(f"/models/{model_id}/inputs")
+
+    async def options(self, model_id: str):
+        return await self._get(f"/models/{model_id}/options")
+
+    async def active(self, model_id: str, voice: str | None = None, config: str | None = None):
+        payload: dict[str, str | None] = {}
+        if voice is not None:
+            payload["voice"] = voice
+        if config is not None:
+            payload["config"] = config
+        return await self._post(f"/models/{model_id}/active", payload)
+
+    async def smoke(self, model_id: str):
+        return await self._post_empty(f"/models/{model_id}/smoke")
+
+    async def predict(self, model_id: str, inputs: dict, content_type: str = JSON_MEDIA_TYPE):
+        return await self._post(f"/predict/{model_id}", inputs, content_type=content_type)
+
+    async def audio_state(self, content_type: str = JSON_MEDIA_TYPE):
+        return await self._get("/audio/state", content_type=content_type)
+
+    async def status(self):
+        return await self._get("/status")
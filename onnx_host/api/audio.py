@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 
 from ..audio import (
@@ -7,20 +9,22 @@ from ..audio import (
     AudioStateNotFoundError,
     audio_engine,
     audio_state_store,
-    enumerate_audio_devices,
     materialize_route,
 )
 from ..config import get_audio_module_enabled, set_audio_module_enabled
+from ..pollers import audio_devices_poller, set_audio_devices_polling
 from ..audio.schemas import (
     AudioControlsUpdateRequest,
     AudioDefaultsUpdateRequest,
     AudioModuleToggleRequest,
     AudioPolicyUpdateRequest,
     AudioRouteUpsertRequest,
+    fields_set,
 )
+from ..transport import MsgpackRoute
 
 
-router = APIRouter(prefix="/audio", tags=["audio"])
+router = APIRouter(prefix="/audio", tags=["audio"], route_class=MsgpackRoute)
 
 
 def _ensure_audio_enabled() -> None:
@@ -34,11 +38,13 @@ def get_audio_module_status():
 
 
 @router.post("/module")
-def set_audio_module_status(req: AudioModuleToggleRequest):
+async def set_audio_module_status(req: AudioModuleToggleRequest):
     enabled = set_audio_module_enabled(req.enabled)
     snapshot = audio_state_store.set_audio_enabled(enabled)
     if not enabled:
-        audio_engine.shutdown_all()
+        # Joins stream workers, so keep it off the event loop.
+        await asyncio.to_thread(audio_engine.shutdown_all)
+    await set_audio_devices_polling(enabled)
     return {
         "enabled": enabled,
         "audio_enabled": snapshot.audio_enabled,
@@ -47,8 +53,9 @@ def set_audio_module_status(req: AudioModuleToggleRequest):
 
 
 @router.get("/devices")
-def get_audio_devices():
-    devices = enumerate_audio_devices()
+def get_audio_devices(refresh: bool = False):
+    # Served from the background poll; refresh=true re-enumerates right away.
+    devices = audio_devices_poller.refresh() if refresh else audio_devices_poller.get()
     snapshot = audio_state_store.snapshot()
     default_input = snapshot.default_input_device_id or devices.default_input_device_id
     default_output = snapshot.default_output_device_id or devices.default_output_device_id
@@ -67,15 +74,15 @@ def get_audio_devices():
 @router.post("/defaults")
 def set_audio_defaults(req: AudioDefaultsUpdateRequest):
     _ensure_audio_enabled()
-    payload = req.dict(exclude_unset=True)
-    update_input = "default_input_device_id" in payload
-    update_output = "default_output_device_id" in payload
+    sent = fields_set(req)
+    update_input = "default_input_device_id" in sent
+    update_output = "default_output_device_id" in sent
     if not update_input and not update_output:
         raise HTTPException(400, "No fields provided for update")
 
-    devices = enumerate_audio_devices()
-    input_ids = {d.id for d in devices.input_devices}
-    output_ids = {d.id for d in devices.output_devices}
+    devices = audio_devices_poller.get()
+    input_ids = devices.input_ids
+    output_ids = devices.output_ids
 
     if (
         update_input
@@ -117,19 +124,8 @@ def set_audio_policy(req: AudioPolicyUpdateRequest):
 
 @router.get("/state")
 def get_audio_state():
-    snapshot = audio_state_store.snapshot()
     return {
-        "audio_enabled": snapshot.audio_enabled,
-        "defaults": {
-            "default_input_device_id": snapshot.default_input_device_id,
-            "default_output_device_id": snapshot.default_output_device_id,
-        },
-        "duplex_policy": snapshot.duplex_policy,
-        "push_to_talk": snapshot.push_to_talk,
-        "routes": [route.dict() for route in snapshot.routes.values()],
-        "streams": [stream.dict() for stream in snapshot.streams.values()],
-        "controls": [control.dict() for control in snapshot.controls.values()],
-        "meters": [meter.dict() for meter in snapshot.meters.values()],
+        **audio_state_store.serialized_state(),
         "adapter_diagnostics": audio_engine.get_adapter_diagnostics(),
         "engine_running": audio_engine.is_running,
     }
@@ -137,7 +133,7 @@ def get_audio_state():
 
 @router.get("/routes")
 def list_audio_routes():
-    return {"routes": [route.dict() for route in audio_state_store.list_routes()]}
+    return {"routes": audio_state_store.serialized_records("routes")}
 
 
 @router.post("/routes")
@@ -164,43 +160,25 @@ def delete_audio_route(route_id: str):
 @router.post("/streams/{stream_id}/start")
 def start_audio_stream(stream_id: str):
     _ensure_audio_enabled()
-    previous_state: str | None = None
     try:
-        previous_state = audio_state_store.get_stream(stream_id).state
-    except AudioStateNotFoundError:
-        previous_state = None
-
-    try:
-        stream, interrupted = audio_state_store.set_stream_state(stream_id, "running")
+        with audio_state_store.transition(stream_id, "running") as change:
+            audio_engine.start_stream(stream_id, state_store=audio_state_store)
+            for interrupted_id in change.interrupted:
+                audio_engine.pause_stream(interrupted_id)
     except AudioStateNotFoundError as exc:
         raise HTTPException(404, str(exc))
     except AudioPolicyViolationError as exc:
         raise HTTPException(409, str(exc))
-    except ValueError as exc:
-        raise HTTPException(400, str(exc))
-
-    try:
-        audio_engine.start_stream(stream_id, state_store=audio_state_store)
-        for interrupted_id in interrupted:
-            audio_engine.pause_stream(interrupted_id)
     except AudioEngineRuntimeError as exc:
-        if previous_state is not None:
-            audio_state_store.set_stream_state_force(stream_id, previous_state)
-            for interrupted_id in interrupted:
-                audio_state_store.set_stream_state_force(interrupted_id, "running")
         audio_engine.stop_stream(stream_id)
         raise HTTPException(500, str(exc))
     except Exception as exc:
-        if previous_state is not None:
-            audio_state_store.set_stream_state_force(stream_id, previous_state)
-            for interrupted_id in interrupted:
-                audio_state_store.set_stream_state_force(interrupted_id, "running")
         audio_engine.stop_stream(stream_id)
         raise HTTPException(500, f"Failed to start stream runtime: {exc}")
 
     return {
-        "stream": stream.dict(),
-        "interrupted_stream_ids": interrupted,
+        "stream": change.stream.dict(),
+        "interrupted_stream_ids": change.interrupted,
         "engine_running": audio_engine.is_running,
     }
 
@@ -208,33 +186,19 @@ def start_audio_stream(stream_id: str):
 @router.post("/streams/{stream_id}/pause")
 def pause_audio_stream(stream_id: str):
     _ensure_audio_enabled()
-    previous_state: str | None = None
-    try:
-        previous_state = audio_state_store.get_stream(stream_id).state
-    except AudioStateNotFoundError:
-        previous_state = None
-
     try:
-        stream, _ = audio_state_store.set_stream_state(stream_id, "paused")
+        with audio_state_store.transition(stream_id, "paused") as change:
+            audio_engine.pause_stream(stream_id)
     except AudioStateNotFoundError as exc:
         raise HTTPException(404, str(exc))
-    except ValueError as exc:
-        raise HTTPException(400, str(exc))
-
-    try:
-        audio_engine.pause_stream(stream_id)
     except AudioEngineRuntimeError as exc:
-        if previous_state is not None:
-            audio_state_store.set_stream_state_force(stream_id, previous_state)
         raise HTTPException(500, str(exc))
     except Exception as exc:
-        if previous_state is not None:
-            audio_state_store.set_stream_state_force(stream_id, previous_state)
         raise HTTPException(500, f"Failed to pause stream runtime: {exc}")
 
     engine_stopped = audio_engine.stop_if_idle(has_running_streams=audio_state_store.any_running_streams())
     return {
-        "stream": stream.dict(),
+        "stream": change.stream.dict(),
         "engine_running": audio_engine.is_running,
         "engine_stopped": engine_stopped,
     }
@@ -243,33 +207,19 @@ def pause_audio_stream(stream_id: str):
 @router.post("/streams/{stream_id}/stop")
 def stop_audio_stream(stream_id: str):
     _ensure_audio_enabled()
-    previous_state: str | None = None
-    try:
-        previous_state = audio_state_store.get_stream(stream_id).state
-    except AudioStateNotFoundError:
-        previous_state = None
-
     try:
-        stream, _ = audio_state_store.set_stream_state(stream_id, "stopped")
+        with audio_state_store.transition(stream_id, "stopped") as change:
+            audio_engine.stop_stream(stream_id)
     except AudioStateNotFoundError as exc:
         raise HTTPException(404, str(exc))
-    except ValueError as exc:
-        raise HTTPException(400, str(exc))
-
-    try:
-        audio_engine.stop_stream(stream_id)
     except AudioEngineRuntimeError as exc:
-        if previous_state is not None:
-            audio_state_store.set_stream_state_force(stream_id, previous_state)
         raise HTTPException(500, str(exc))
     except Exception as exc:
-        if previous_state is not None:
-            audio_state_store.set_stream_state_force(stream_id, previous_state)
         raise HTTPException(500, f"Failed to stop stream runtime: {exc}")
 
     engine_stopped = audio_engine.stop_if_idle(has_running_streams=audio_state_store.any_running_streams())
     return {
-        "stream": stream.dict(),
+        "stream": change.stream.dict(),
         "engine_running": audio_engine.is_running,
         "engine_stopped": engine_stopped,
     }
@@ -278,10 +228,10 @@ def stop_audio_stream(stream_id: str):
 @router.post("/controls")
 def update_audio_controls(req: AudioControlsUpdateRequest):
     _ensure_audio_enabled()
-    payload = req.dict(exclude_unset=True)
-    update_gain = "gain_db" in payload
-    update_muted = "muted" in payload
-    update_push_to_talk = "push_to_talk" in payload
+    sent = fields_set(req)
+    update_gain = "gain_db" in sent
+    update_muted = "muted" in sent
+    update_push_to_talk = "push_to_talk" in sent
 
     if not (update_gain or update_muted or update_push_to_talk):
         raise HTTPException(400, "No control fields provided for update")
@@ -318,6 +268,6 @@ def update_audio_controls(req: AudioControlsUpdateRequest):
 def get_audio_meters():
     _ensure_audio_enabled()
     return {
-        "meters": [meter.dict() for meter in audio_state_store.list_meters()],
+        "meters": audio_state_store.serialized_records("meters"),
         "engine_running": audio_engine.is_running,
     }
@@ -3,11 +3,14 @@ from pathlib import Path
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from ..runtime import create_session
-from ..state import hot_models
+from ..batching import PredictBatcher, has_dynamic_batch_dim
+from ..config import PREDICT_MAX_BATCH_SIZE, PREDICT_MAX_WAIT_MS
+from ..runtime import BoundSession, create_session, run_in_ort_executor
+from ..state import bound_sessions, hot_models, predict_batchers, set_hot_model
+from ..transport import MsgpackRoute, NegotiatedResponse
 
 
-router = APIRouter()
+router = APIRouter(route_class=MsgpackRoute)
 
 
 class ModelLoadRequest(BaseModel):
@@ -17,6 +20,22 @@ class ModelLoadRequest(BaseModel):
     providers: list[str] | None = None
 
 
+def _register_hot_session(model_name: str, session) -> None:
+    previous = predict_batchers.pop(model_name, None)
+    if previous is not None:
+        previous.close()
+    bound = BoundSession(session)
+    bound_sessions[model_name] = bound
+    if PREDICT_MAX_BATCH_SIZE > 1 and has_dynamic_batch_dim(session):
+        batcher = PredictBatcher(
+            bound,
+            max_batch_size=PREDICT_MAX_BATCH_SIZE,
+            max_wait_ms=PREDICT_MAX_WAIT_MS,
+        )
+        batcher.start()
+        predict_batchers[model_name] = batcher
+
+
 @router.post("/Load")
 async def load_model(request: ModelLoadRequest):
     try:
@@ -27,7 +46,8 @@ async def load_model(request: ModelLoadRequest):
             )
 
         session = create_session(request.path, request.providers)
-        hot_models[request.name] = session
+        set_hot_model(request.name, session)
+        _register_hot_session(request.name, session)
         return {"status": "success", "message": f"Model {request.name} loaded."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -38,7 +58,17 @@ async def predict(model_name: str, input_data: dict):
     if model_name not in hot_models:
         raise HTTPException(status_code=404, detail="Model not loaded")
 
-    session = hot_models[model_name]
-    outputs = session.run(None, input_data)
-    return {"output": str(outputs)}
+    batcher = predict_batchers.get(model_name)
+    if batcher is not None:
+        outputs = await batcher.submit(input_data)
+    else:
+        bound = bound_sessions.get(model_name)
+        if bound is not None:
+            outputs = await run_in_ort_executor(bound.run, input_data)
+        else:
+            session = hot_models[model_name]
+            outputs = await run_in_ort_executor(session.run, None, input_data)
+    # Returned as a Response so the arrays go straight to orjson's (or
+    # msgpack's) encoder instead of through FastAPI's jsonable_encoder.
+    return NegotiatedResponse({"outputs": outputs})
 
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Query
 
 from ..logs import clear_logs, get_recent_logs
+from ..transport import MsgpackRoute
 
 
-router = APIRouter()
+router = APIRouter(route_class=MsgpackRoute)
 
 
 @router.get("/logs")
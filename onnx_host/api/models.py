@@ -1,54 +1,87 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import gc
+import os
+import re
 import time
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel
 
 from ..config import MODELS_DIR, REGISTRY_PATH, normalize_model_path
-from ..registry import scan_models_registry
-from ..runtime import run_smoke_test
-from ..selectors import _list_selectables, model_kind
-from ..state import active_model_options, hot_models, loaded_models
+from ..registry import get_registry_model, invalidate_registry_cache, scan_models_registry
+from ..runtime import run_in_ort_executor, run_smoke_test
+from ..selectors import _list_selectables, _selectable_sets, model_kind
+from ..state import (
+    active_model_options,
+    bound_sessions,
+    hot_models,
+    loaded_models,
+    pop_hot_model,
+    predict_batchers,
+)
+from ..transport import MsgpackRoute
 from .engine import ModelLoadRequest, load_model
 
 
-router = APIRouter()
+router = APIRouter(route_class=MsgpackRoute)
+
+
+_LFS_POINTER_PREFIX = b"version https://git-lfs.github.com/spec/v1"
+# Matched against the file name after the model stem, e.g. ".onnx_data_3".
+_SHARD_SUFFIX_RE = re.compile(r"\.onnx_data(?:_(\d+))?")
+_SHARD_CHECK_WORKERS = 8
+
+
+def _check_shard(data_file: Path) -> None:
+    try:
+        try:
+            size = os.stat(data_file).st_size
+        except FileNotFoundError:
+            raise HTTPException(400, f"Missing external data shard: {data_file.name}")
+        if size == 0:
+            raise HTTPException(400, f"External data shard is empty: {data_file.name}")
+        fd = os.open(data_file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            header = os.read(fd, 64)
+        finally:
+            os.close(fd)
+        if header.startswith(_LFS_POINTER_PREFIX):
+            raise HTTPException(
+                400,
+                f"External data shard is a Git LFS pointer: {data_file.name}. Run 'git lfs pull'.",
+            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(400, f"External data file error: {data_file} ({e})")
 
 
 def _verify_external_data(model_path: Path):
-    data_files = list(model_path.parent.glob(f"{model_path.stem}.onnx_data*"))
+    stem = model_path.stem
+    data_files = list(model_path.parent.glob(f"{stem}.onnx_data*"))
     if not data_files:
         return
     indexed = {}
     for data_file in data_files:
-        suffix = data_file.name.replace(f"{model_path.stem}.onnx_data", "")
-        if suffix.startswith("_") and suffix[1:].isdigit():
-            indexed[int(suffix[1:])] = data_file
+        match = _SHARD_SUFFIX_RE.fullmatch(data_file.name, len(stem))
+        if match and match.group(1):
+            indexed[int(match.group(1))] = data_file
     if indexed:
         max_idx = max(indexed)
         missing = [i for i in range(1, max_idx + 1) if i not in indexed]
         if missing:
-            missing_names = ", ".join(f"{model_path.stem}.onnx_data_{i}" for i in missing)
+            missing_names = ", ".join(f"{stem}.onnx_data_{i}" for i in missing)
             raise HTTPException(400, f"Missing external data shard(s): {missing_names}")
-    for data_file in data_files:
-        try:
-            if not data_file.exists():
-                raise HTTPException(400, f"Missing external data shard: {data_file.name}")
-            size = data_file.stat().st_size
-            if size == 0:
-                raise HTTPException(400, f"External data shard is empty: {data_file.name}")
-            with data_file.open("rb") as handle:
-                header = handle.read(64)
-                if header.startswith(b"version https://git-lfs.github.com/spec/v1"):
-                    raise HTTPException(
-                        400,
-                        f"External data shard is a Git LFS pointer: {data_file.name}. Run 'git lfs pull'.",
-                    )
-        except Exception as e:
-            if isinstance(e, HTTPException):
-                raise
-            raise HTTPException(400, f"External data file error: {data_file} ({e})")
+
+    if len(data_files) == 1:
+        _check_shard(data_files[0])
+        return
+    with ThreadPoolExecutor(max_workers=min(_SHARD_CHECK_WORKERS, len(data_files))) as pool:
+        # Consume the iterator so the first failing shard's HTTPException propagates.
+        for _ in pool.map(_check_shard, data_files):
+            pass
 
 
 @router.get("/models")
@@ -68,20 +101,20 @@ class ModelActiveRequest(BaseModel):
 
 @router.post("/models/{model_id}/active")
 def set_model_active(model_id: str, req: ModelActiveRequest):
-    options = _list_selectables(model_id)
+    options = _selectable_sets(model_id)
     active = active_model_options.get(model_id, {"voice": None, "config": None})
     if req.voice is not None:
         if req.voice == "":
             active["voice"] = None
         else:
-            if req.voice not in options.get("voices", []):
+            if req.voice not in options["voices"]:
                 raise HTTPException(400, "Voice option not found")
             active["voice"] = req.voice
     if req.config is not None:
         if req.config == "":
             active["config"] = None
         else:
-            if req.config not in options.get("configs", []):
+            if req.config not in options["configs"]:
                 raise HTTPException(400, "Config option not found")
             active["config"] = req.config
     active_model_options[model_id] = active
@@ -102,16 +135,14 @@ async def load_model_ui(req: UILoadRequest):
     if not REGISTRY_PATH.exists():
         raise HTTPException(500, "models.json missing")
 
-    registry = scan_models_registry()
-    models = registry.get("models", [])
-
-    if model_id not in [m.get("id") for m in models]:
+    model = get_registry_model(model_id)
+    if model is None:
         raise HTTPException(404, "Model not registered")
 
-    model = next(m for m in models if m.get("id") == model_id)
     if model.get("missing"):
         raise HTTPException(404, "Model folder missing on disk")
-    if not model.get("path"):
+    model_rel_path = model.get("path")
+    if not model_rel_path:
         raise HTTPException(400, "Model has no .onnx artifacts to load")
 
     if variant_id:
@@ -122,11 +153,11 @@ async def load_model_ui(req: UILoadRequest):
         onnx_candidates = [a for a in (variant.get("artifacts") or []) if a.endswith(".onnx")]
         if not onnx_candidates:
             raise HTTPException(400, "Variant has no .onnx artifacts to load")
-        model["path"] = onnx_candidates[0]
+        model_rel_path = onnx_candidates[0]
 
     # delegate to your existing loader
-    model_path = (MODELS_DIR / model["path"]).resolve()
-    _verify_external_data(model_path)
+    model_path = (MODELS_DIR / model_rel_path).resolve()
+    await asyncio.to_thread(_verify_external_data, model_path)
 
     providers = ["CPUExecutionProvider"] if model_kind(model_id) == "tts" else ["DmlExecutionProvider"]
 
@@ -139,6 +170,7 @@ async def load_model_ui(req: UILoadRequest):
     await load_model(engine_req)  # call existing function
 
     loaded_models.add(model_id)
+    invalidate_registry_cache()
 
     return {"status": "loaded", "id": model_id}
 
@@ -148,7 +180,7 @@ class UIUnloadRequest(BaseModel):
 
 
 @router.post("/models/unload")
-def unload_model_ui(req: UIUnloadRequest):
+def unload_model_ui(req: UIUnloadRequest, background_tasks: BackgroundTasks):
     model_id = req.id
 
     if model_id not in loaded_models:
@@ -157,12 +189,20 @@ def unload_model_ui(req: UIUnloadRequest):
             "id": model_id,
         }
 
-    session = hot_models.pop(model_id, None)
+    batcher = predict_batchers.pop(model_id, None)
+    if batcher is not None:
+        batcher.close()
+    bound_sessions.pop(model_id, None)
+
+    session = pop_hot_model(model_id)
     if session is not None:
         del session
-        gc.collect()
+        # ORT frees native memory when the session is destroyed; the collection
+        # only sweeps leftover Python cycles, so run it after the response.
+        background_tasks.add_task(gc.collect)
 
     loaded_models.remove(model_id)
+    invalidate_registry_cache()
 
     return {
         "status": "unloaded",
@@ -189,7 +229,7 @@ def get_model_inputs(model_id: str):
 
 
 @router.post("/models/{model_id}/smoke")
-def smoke_test(model_id: str):
+async def smoke_test(model_id: str):
     if model_id not in hot_models:
         raise HTTPException(404, "Model not loaded")
 
@@ -198,7 +238,7 @@ def smoke_test(model_id: str):
 
     start = time.perf_counter()
     try:
-        run_smoke_test(session, kind)
+        await run_in_ort_executor(run_smoke_test, session, kind)
     except Exception as e:
         raise HTTPException(500, f"Smoke test failed: {e}")
 
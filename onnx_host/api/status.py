@@ -1,17 +1,20 @@
 from fastapi import APIRouter
 
 from ..config import get_audio_module_enabled
-from ..dxgi import get_vram_status
+from ..pollers import vram_status_poller
+from ..transport import MsgpackRoute
 
 
-router = APIRouter()
+router = APIRouter(route_class=MsgpackRoute)
 
 
 @router.get("/status")
 async def get_gpu_status():
-    """Returns VRAM usage via DXGI for the first detected adapter."""
-    payload = get_vram_status()
-    payload["features"] = {
-        "audio_module_enabled": get_audio_module_enabled(),
+    """Returns the latest polled VRAM usage via DXGI for the first detected adapter."""
+    snapshot = await vram_status_poller.get_async()
+    return {
+        **snapshot,
+        "features": {
+            "audio_module_enabled": get_audio_module_enabled(),
+        },
     }
-    return payload
@@ -1,16 +1,42 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import re
+import threading
+import weakref
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Sequence
 
 import numpy as np
 
-from ..selectors import model_kind
-from ..state import hot_models
+from ..state import bound_sessions, hot_models_by_kind
 
 
 LOGGER = logging.getLogger(__name__)
 
+_ROLE_FEATURES = "features"
+_ROLE_WAVEFORM = "waveform"
+_ROLE_LENGTH = "length"
+_ROLE_INPUT_IDS = "input_ids"
+_ROLE_ATTENTION_MASK = "attention_mask"
+_ROLE_STYLE = "style"
+_ROLE_SPEED = "speed"
+_ROLE_ZERO = "zero"
+
+_WAVEFORM_NAME_RE = re.compile(r"audio|wave|sample")
+_LENGTH_NAME_RE = re.compile(r"length|_len|len$")
+
+
+@dataclass(frozen=True)
+class _InputSpec:
+    name: str
+    role: str
+    dtype: np.dtype
+    shape: tuple[int, ...]
+    # Leading dimension is symbolic, so several frames can share one run.
+    dynamic_batch: bool
+
 
 def _dtype_for_input(input_type: str):
     t = (input_type or "").lower()
@@ -39,57 +65,214 @@ def _shape_for_input(shape) -> list[int]:
     return cooked
 
 
+# Input names repeat across sessions and reloads, so classification is memoized
+# on the raw name on top of the per-session plan cache.
+@lru_cache(maxsize=64)
+def _asr_input_role(name: str) -> str:
+    lname = name.lower()
+    if name == "input_features":
+        return _ROLE_FEATURES
+    if _WAVEFORM_NAME_RE.search(lname):
+        return _ROLE_WAVEFORM
+    if _LENGTH_NAME_RE.search(lname):
+        return _ROLE_LENGTH
+    if name == "input_ids":
+        return _ROLE_INPUT_IDS
+    if "attention_mask" in lname:
+        return _ROLE_ATTENTION_MASK
+    return _ROLE_ZERO
+
+
+@lru_cache(maxsize=64)
+def _tts_input_role(name: str) -> str:
+    lname = name.lower()
+    if name == "input_ids":
+        return _ROLE_INPUT_IDS
+    if name == "style":
+        return _ROLE_STYLE
+    if name == "speed":
+        return _ROLE_SPEED
+    if _LENGTH_NAME_RE.search(lname):
+        return _ROLE_LENGTH
+    if "attention_mask" in lname:
+        return _ROLE_ATTENTION_MASK
+    return _ROLE_ZERO
+
+
+_ROLE_CLASSIFIERS = {"asr": _asr_input_role, "tts": _tts_input_role}
+
+# Input metadata never changes for a session, so each one is classified once per
+# adapter kind. Entries go away with the session when the model is unloaded.
+_INPUT_PLANS: weakref.WeakKeyDictionary[Any, dict[str, tuple[_InputSpec, ...]]] = weakref.WeakKeyDictionary()
+
+
+# Per output: whether its leading dimension is symbolic, i.e. follows the batch.
+_BATCHED_OUTPUTS: weakref.WeakKeyDictionary[Any, tuple[bool, ...]] = weakref.WeakKeyDictionary()
+
+
+def _batched_outputs(session: Any) -> tuple[bool, ...]:
+    batched = _BATCHED_OUTPUTS.get(session)
+    if batched is None:
+        batched = tuple(
+            bool(out.shape) and not (isinstance(out.shape[0], int) and out.shape[0] > 0)
+            for out in session.get_outputs()
+        )
+        _BATCHED_OUTPUTS[session] = batched
+    return batched
+
+
+def _input_plan(session: Any, kind: str) -> tuple[_InputSpec, ...]:
+    plans = _INPUT_PLANS.get(session)
+    if plans is None:
+        plans = _INPUT_PLANS.setdefault(session, {})
+    plan = plans.get(kind)
+    if plan is None:
+        classify = _ROLE_CLASSIFIERS[kind]
+        plan = tuple(
+            _InputSpec(
+                name=inp.name,
+                role=classify(inp.name),
+                dtype=np.dtype(_dtype_for_input(inp.type)),
+                shape=tuple(_shape_for_input(inp.shape)),
+                dynamic_batch=bool(inp.shape) and not (isinstance(inp.shape[0], int) and inp.shape[0] > 0),
+            )
+            for inp in session.get_inputs()
+        )
+        plans[kind] = plan
+    return plan
+
+
+# Shared empty signal for the TTS no-model/error/no-audio paths.
+_EMPTY_F32 = np.zeros((0,), dtype=np.float32)
+_EMPTY_F32.flags.writeable = False
+
+
+# Constant inputs are shared read-only across requests; ORT never writes to its inputs.
+@lru_cache(maxsize=32)
+def _ones_tensor(shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    ones = np.ones(shape, dtype=dtype)
+    ones.flags.writeable = False
+    return ones
+
+
+@lru_cache(maxsize=8)
+def _zeros_tensor(shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    zeros = np.zeros(shape, dtype=dtype)
+    zeros.flags.writeable = False
+    return zeros
+
+
 def _resolve_loaded_model(kind: str, preferred_model_id: str | None = None) -> tuple[str, Any] | None:
+    bucket = hot_models_by_kind.get(kind)
+    if not bucket:
+        return None
     if preferred_model_id:
-        session = hot_models.get(preferred_model_id)
-        if session is not None and model_kind(preferred_model_id) == kind:
+        session = bucket.get(preferred_model_id)
+        if session is not None:
             return preferred_model_id, session
+    return next(iter(bucket.items()), None)
+
+
+# Per-thread buffer for rectified samples. Capture/ingress workers pool a frame
+# per block, so the abs pass reuses memory instead of allocating each time.
+_SCRATCH = threading.local()
+
+
+def _abs_scratch(rows: int, cols: int) -> np.ndarray:
+    needed = rows * cols
+    buf = getattr(_SCRATCH, "buf", None)
+    if buf is None or buf.size < needed:
+        buf = np.empty((needed,), dtype=np.float32)
+        _SCRATCH.buf = buf
+    return buf[:needed].reshape(rows, cols)
 
-    for candidate_id, session in hot_models.items():
-        if model_kind(candidate_id) == kind:
-            return candidate_id, session
-    return None
 
+@lru_cache(maxsize=8)
+def _mean_weights(chunk: int) -> np.ndarray:
+    weights = np.full((chunk,), 1.0 / chunk, dtype=np.float32)
+    weights.flags.writeable = False
+    return weights
 
-def _build_feature_tensor(samples_16k_mono: np.ndarray, shape: list[int]) -> np.ndarray:
-    t = shape[2] if len(shape) >= 3 else max(16, int(samples_16k_mono.size / 200))
+
+def _build_feature_tensor(
+    samples_16k_mono: np.ndarray,
+    shape: tuple[int, ...],
+    dtype: np.dtype = np.dtype(np.float32),
+) -> np.ndarray:
+    return _build_feature_batch(samples_16k_mono.reshape(1, -1), shape, dtype)
+
+
+def _build_feature_batch(
+    frames: np.ndarray,
+    shape: tuple[int, ...],
+    dtype: np.dtype = np.dtype(np.float32),
+) -> np.ndarray:
+    """(B, 80, t) energy features for a (B, n) stack of equal-length frames."""
+    batch, size = frames.shape
+    t = shape[2] if len(shape) >= 3 else max(16, int(size / 200))
     t = max(1, int(t))
-    features = np.zeros((1, 80, t), dtype=np.float32)
-    if samples_16k_mono.size == 0:
-        return features
-
-    abs_samples = np.abs(samples_16k_mono)
-    chunk = max(1, int(abs_samples.size / t))
-    for idx in range(t):
-        start = idx * chunk
-        end = min(abs_samples.size, start + chunk)
-        energy = float(abs_samples[start:end].mean()) if end > start else 0.0
-        features[0, :, idx] = energy
+    energy = np.zeros((batch, t), dtype=np.float32)
+    if size:
+        chunk = max(1, int(size / t))
+        # Blocks past the end of a short frame stay at zero; samples past t*chunk are dropped,
+        # so only the pooled prefix is rectified and the means land directly in energy.
+        blocks = min(t, size // chunk)
+        pooled = np.abs(frames[:, : blocks * chunk], out=_abs_scratch(batch, blocks * chunk))
+        # Block means as a matvec against a 1/chunk vector: BLAS sgemv is several
+        # times faster than np.mean's strided reduction, especially for short blocks.
+        np.matmul(pooled.reshape(batch, blocks, chunk), _mean_weights(chunk), out=energy[:, :blocks])
+
+    # Every mel bin carries the same energy. ORT needs a contiguous tensor, so the
+    # row is written out once per bin here rather than copied later.
+    features = np.empty((batch, 80, t), dtype=dtype)
+    features[...] = energy[:, None, :]
     return features
 
 
-def _fit_waveform_tensor(samples: np.ndarray, shape: list[int]) -> np.ndarray:
+def _fit_waveform_tensor(
+    samples: np.ndarray,
+    shape: tuple[int, ...],
+    dtype: np.dtype = np.dtype(np.float32),
+) -> np.ndarray:
     if len(shape) == 1:
-        target = shape[0]
-        out = np.zeros((target,), dtype=np.float32)
-        copy_n = min(target, samples.size)
-        out[:copy_n] = samples[:copy_n]
-        return out
-
-    if len(shape) == 2:
-        target = shape[1]
-        out = np.zeros((1, target), dtype=np.float32)
-        copy_n = min(target, samples.size)
-        out[0, :copy_n] = samples[:copy_n]
-        return out
-
-    out = np.zeros(shape, dtype=np.float32)
-    flat = out.reshape(-1)
+        out = np.empty((shape[0],), dtype=dtype)
+        flat = out
+    elif len(shape) == 2:
+        out = np.empty((1, shape[1]), dtype=dtype)
+        flat = out[0]
+    else:
+        out = np.empty(shape, dtype=dtype)
+        flat = out.reshape(-1)
+
+    # Only the padding past the copied prefix needs zeroing.
     copy_n = min(flat.size, samples.size)
     flat[:copy_n] = samples[:copy_n]
+    if copy_n < flat.size:
+        flat[copy_n:] = 0.0
     return out
 
 
+def _run_session(model_id: str, session: Any, inputs: dict[str, np.ndarray]) -> list:
+    # Hot models loaded through the engine carry a BoundSession that reuses one
+    # IOBinding per input signature, which suits the fixed-shape adapter feeds.
+    bound = bound_sessions.get(model_id)
+    if bound is not None and bound.session is session:
+        return bound.run(inputs)
+    return session.run(None, inputs)
+
+
+def _as_frame(samples: Any) -> np.ndarray:
+    """Flat float32 view of an ingress frame, passed through untouched when it already is one."""
+    if isinstance(samples, np.ndarray) and samples.dtype == np.float32 and samples.ndim == 1:
+        return samples
+    return np.asarray(samples, dtype=np.float32).reshape(-1)
+
+
+def _output_shapes(outputs: list[Any]) -> list[list[int]]:
+    # ORT hands back ndarrays; only wrap the odd non-array output (e.g. sequences).
+    return [list(out.shape) if isinstance(out, np.ndarray) else list(np.asarray(out).shape) for out in outputs]
+
+
 def ingest_asr_frame(
     samples_16k_mono: np.ndarray,
     *,
@@ -100,31 +283,26 @@ def ingest_asr_frame(
         return {"status": "no_model"}
 
     resolved_id, session = resolved
-    frame = np.asarray(samples_16k_mono, dtype=np.float32).reshape(-1)
+    frame = _as_frame(samples_16k_mono)
     inputs: dict[str, np.ndarray] = {}
 
     try:
-        for inp in session.get_inputs():
-            lname = inp.name.lower()
-            dtype = _dtype_for_input(inp.type)
-            shape = _shape_for_input(inp.shape)
-
-            if inp.name == "input_features":
-                value = _build_feature_tensor(frame, shape).astype(dtype)
-            elif "audio" in lname or "wave" in lname or "sample" in lname:
-                value = _fit_waveform_tensor(frame, shape).astype(dtype)
-            elif "length" in lname or lname.endswith("len") or "_len" in lname:
-                value = np.array([frame.size], dtype=np.int64).astype(dtype)
-            elif inp.name == "input_ids":
-                value = np.array([[1]], dtype=np.int64).astype(dtype)
-            elif "attention_mask" in lname:
-                value = np.array([[1]], dtype=np.int64).astype(dtype)
+        for spec in _input_plan(session, "asr"):
+            role, dtype = spec.role, spec.dtype
+            if role == _ROLE_FEATURES:
+                value = _build_feature_tensor(frame, spec.shape, dtype)
+            elif role == _ROLE_WAVEFORM:
+                value = _fit_waveform_tensor(frame, spec.shape, dtype)
+            elif role == _ROLE_LENGTH:
+                value = np.array([frame.size], dtype=np.int64).astype(dtype, copy=False)
+            elif role == _ROLE_INPUT_IDS or role == _ROLE_ATTENTION_MASK:
+                value = _ones_tensor((1, 1), dtype)
             else:
-                value = np.zeros(shape, dtype=dtype)
-            inputs[inp.name] = value
+                value = np.zeros(spec.shape, dtype=dtype)
+            inputs[spec.name] = value
 
-        outputs = session.run(None, inputs)
-        output_shapes = [list(np.asarray(out).shape) for out in outputs]
+        outputs = _run_session(resolved_id, session, inputs)
+        output_shapes = _output_shapes(outputs)
         return {
             "status": "ok",
             "model_id": resolved_id,
@@ -139,30 +317,102 @@ def ingest_asr_frame(
         }
 
 
+def _fit_waveform_batch(frames: np.ndarray, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    batch, size = frames.shape
+    row_shape = shape[1:]
+    target = int(np.prod(row_shape))
+    out = np.empty((batch, target), dtype=dtype)
+    copy_n = min(target, size)
+    out[:, :copy_n] = frames[:, :copy_n]
+    if copy_n < target:
+        out[:, copy_n:] = 0.0
+    return out.reshape((batch, *row_shape))
+
+
+def _asr_plan_batches(plan: tuple[_InputSpec, ...]) -> bool:
+    # A 1-D waveform input has no batch axis, only samples.
+    return all(
+        spec.dynamic_batch and (spec.role != _ROLE_WAVEFORM or len(spec.shape) >= 2)
+        for spec in plan
+    )
+
+
+def ingest_asr_frames(
+    frames: Sequence[np.ndarray],
+    *,
+    model_id: str | None = None,
+) -> list[dict[str, object]]:
+    """
+    Batched ingest_asr_frame: equal-length frames go through one session.run
+    when every model input has a dynamic batch dimension. Otherwise each frame
+    is ingested on its own. Returns one result per frame, in order.
+    """
+    resolved = _resolve_loaded_model("asr", preferred_model_id=model_id)
+    if resolved is None:
+        return [{"status": "no_model"} for _ in frames]
+
+    resolved_id, session = resolved
+    flat = [_as_frame(frame) for frame in frames]
+    plan = _input_plan(session, "asr")
+    if len(flat) < 2 or len({frame.size for frame in flat}) != 1 or not _asr_plan_batches(plan):
+        return [ingest_asr_frame(frame, model_id=resolved_id) for frame in flat]
+
+    stacked = np.stack(flat)
+    batch, size = stacked.shape
+    inputs: dict[str, np.ndarray] = {}
+
+    try:
+        for spec in plan:
+            role, dtype = spec.role, spec.dtype
+            if role == _ROLE_FEATURES:
+                value = _build_feature_batch(stacked, spec.shape, dtype)
+            elif role == _ROLE_WAVEFORM:
+                value = _fit_waveform_batch(stacked, spec.shape, dtype)
+            elif role == _ROLE_LENGTH:
+                value = np.full((batch,), size, dtype=np.int64).astype(dtype, copy=False)
+            elif role == _ROLE_INPUT_IDS or role == _ROLE_ATTENTION_MASK:
+                value = _ones_tensor((batch, 1), dtype)
+            else:
+                value = np.zeros((batch, *spec.shape[1:]), dtype=dtype)
+            inputs[spec.name] = value
+
+        outputs = _run_session(resolved_id, session, inputs)
+    except Exception as exc:
+        LOGGER.debug("ASR adapter batch ingest failed for %s", resolved_id, exc_info=True)
+        return [{"status": "error", "model_id": resolved_id, "error": str(exc)} for _ in flat]
+
+    # Report each frame's outputs as if it had been run alone: only outputs whose
+    # leading dimension is symbolic carry the batch; static ones keep their shape.
+    frame_shapes = _output_shapes(outputs)
+    for out_shape, batched in zip(frame_shapes, _batched_outputs(session)):
+        if batched and out_shape and out_shape[0] == batch:
+            out_shape[0] = 1
+    return [
+        {"status": "ok", "model_id": resolved_id, "output_shapes": [list(s) for s in frame_shapes]}
+        for _ in flat
+    ]
+
+
 def _tokenize_text(text: str, *, max_tokens: int = 128) -> np.ndarray:
-    raw = list(text.encode("utf-8")[:max_tokens])
-    if not raw:
-        raw = [1]
-    return np.asarray([[(b % 255) + 1 for b in raw]], dtype=np.int64)
+    raw = text.encode("utf-8")[:max_tokens] or b"\x01"
+    tokens = np.frombuffer(raw, dtype=np.uint8).astype(np.int64)
+    tokens %= 255
+    tokens += 1
+    return tokens.reshape(1, -1)
 
 
-def _select_audio_output(outputs: list[Any]) -> np.ndarray:
+def _select_audio_output(outputs: list[Any]) -> tuple[np.ndarray, float]:
+    """First non-empty numeric output as float32 mono, with its absolute peak."""
     for out in outputs:
-        arr = np.asarray(out)
+        arr = out if isinstance(out, np.ndarray) else np.asarray(out)
         if arr.size == 0:
             continue
-        if np.issubdtype(arr.dtype, np.floating):
-            audio = arr.astype(np.float32).reshape(-1)
-            if audio.size > 0:
-                return audio
-        if np.issubdtype(arr.dtype, np.integer):
-            audio = arr.astype(np.float32).reshape(-1)
-            max_abs = float(np.max(np.abs(audio)))
-            if max_abs > 0:
-                audio = audio / max_abs
-            if audio.size > 0:
-                return audio
-    return np.zeros((0,), dtype=np.float32)
+        if np.issubdtype(arr.dtype, np.floating) or np.issubdtype(arr.dtype, np.integer):
+            # float32 outputs (the common case) are used in place; the session
+            # hands back fresh arrays per run, so the caller may scale them.
+            audio = arr.astype(np.float32, copy=False).reshape(-1)
+            return audio, float(np.max(np.abs(audio)))
+    return _EMPTY_F32, 0.0
 
 
 def synthesize_tts_signal(
@@ -172,7 +422,7 @@ def synthesize_tts_signal(
 ) -> tuple[np.ndarray, dict[str, object]]:
     resolved = _resolve_loaded_model("tts", preferred_model_id=model_id)
     if resolved is None:
-        return np.zeros((0,), dtype=np.float32), {"status": "no_model"}
+        return _EMPTY_F32, {"status": "no_model"}
 
     resolved_id, session = resolved
     token_ids = _tokenize_text(text)
@@ -180,46 +430,43 @@ def synthesize_tts_signal(
     inputs: dict[str, np.ndarray] = {}
 
     try:
-        for inp in session.get_inputs():
-            lname = inp.name.lower()
-            dtype = _dtype_for_input(inp.type)
-            shape = _shape_for_input(inp.shape)
-
-            if inp.name == "input_ids":
-                value = token_ids.astype(dtype)
-            elif inp.name == "style":
-                value = np.zeros((1, 256), dtype=np.float32).astype(dtype)
-            elif inp.name == "speed":
-                value = np.array([1.0], dtype=np.float32).astype(dtype)
-            elif "length" in lname or lname.endswith("len") or "_len" in lname:
-                value = np.array([token_len], dtype=np.int64).astype(dtype)
-            elif "attention_mask" in lname:
-                value = np.ones((1, token_len), dtype=np.int64).astype(dtype)
+        for spec in _input_plan(session, "tts"):
+            role, dtype = spec.role, spec.dtype
+            if role == _ROLE_INPUT_IDS:
+                value = token_ids.astype(dtype, copy=False)
+            elif role == _ROLE_STYLE:
+                value = _zeros_tensor((1, 256), dtype)
+            elif role == _ROLE_SPEED:
+                value = _ones_tensor((1,), dtype)
+            elif role == _ROLE_LENGTH:
+                value = np.array([token_len], dtype=np.int64).astype(dtype, copy=False)
+            elif role == _ROLE_ATTENTION_MASK:
+                value = _ones_tensor((1, token_len), dtype)
             else:
-                value = np.zeros(shape, dtype=dtype)
-            inputs[inp.name] = value
+                value = np.zeros(spec.shape, dtype=dtype)
+            inputs[spec.name] = value
 
-        outputs = session.run(None, inputs)
-        audio = _select_audio_output(outputs)
+        outputs = _run_session(resolved_id, session, inputs)
+        audio, peak = _select_audio_output(outputs)
         if audio.size == 0:
             return audio, {
                 "status": "no_audio_output",
                 "model_id": resolved_id,
-                "output_shapes": [list(np.asarray(out).shape) for out in outputs],
+                "output_shapes": _output_shapes(outputs),
             }
 
-        peak = float(np.max(np.abs(audio)))
+        # One in-place scale to a 0.8 peak, for float and integer outputs alike.
         if peak > 1e-6:
-            audio = (audio / peak) * 0.8
+            np.multiply(audio, np.float32(0.8 / peak), out=audio)
 
-        return audio.astype(np.float32, copy=False), {
+        return audio, {
             "status": "ok",
             "model_id": resolved_id,
             "sample_count": int(audio.size),
         }
     except Exception as exc:
         LOGGER.debug("TTS adapter synth failed for %s", resolved_id, exc_info=True)
-        return np.zeros((0,), dtype=np.float32), {
+        return _EMPTY_F32, {
             "status": "error",
             "model_id": resolved_id,
             "error": str(exc),
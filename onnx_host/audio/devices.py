@@ -1,45 +1,78 @@
+from typing import Any
+
 from .schemas import AudioDevice, AudioDevicesResponse
 
 
+# A missing backend will not appear while the process runs, so that answer is
+# prebuilt and the import is not retried on every poll.
+_MISSING_BACKEND_RESPONSE = AudioDevicesResponse(
+    backend="none",
+    error="Audio device backend is not installed.",
+    error_code="missing_dependency",
+    hint="Install 'sounddevice' (pip install sounddevice) and restart the backend.",
+)
+_sounddevice: Any = None
+_sounddevice_missing = False
+
+
+def _load_sounddevice() -> Any:
+    """Import sounddevice once; None if it is not installed."""
+    global _sounddevice, _sounddevice_missing
+    if _sounddevice is None and not _sounddevice_missing:
+        try:
+            import sounddevice as sd  # type: ignore
+        except ModuleNotFoundError as exc:
+            if exc.name != "sounddevice":
+                raise
+            _sounddevice_missing = True
+        else:
+            _sounddevice = sd
+    return _sounddevice
+
+
+def _backend_error_response(exc: Exception) -> AudioDevicesResponse:
+    return AudioDevicesResponse(
+        backend="none",
+        error=str(exc),
+        error_code="backend_error",
+        hint="Check runtime logs for details.",
+    )
+
+
 def enumerate_audio_devices() -> AudioDevicesResponse:
     """
     Best-effort device listing for Phase 1 control plane.
     If `sounddevice` is not installed, return an empty inventory.
     """
     try:
-        import sounddevice as sd  # type: ignore
+        sd = _load_sounddevice()
+        if sd is None:
+            return _MISSING_BACKEND_RESPONSE
 
         all_devices = sd.query_devices()
         default_input_id, default_output_id = sd.default.device
 
-        input_devices: list[AudioDevice] = []
-        output_devices: list[AudioDevice] = []
-
-        for index, dev in enumerate(all_devices):
-            max_in = int(dev.get("max_input_channels", 0))
-            max_out = int(dev.get("max_output_channels", 0))
-            sample_rate = dev.get("default_samplerate")
-            name = str(dev.get("name", f"device-{index}"))
-            device_id = str(index)
-
-            if max_in > 0:
-                input_devices.append(
-                    AudioDevice(
-                        id=device_id,
-                        name=name,
-                        channels=max_in,
-                        sample_rate=sample_rate,
-                    )
-                )
-            if max_out > 0:
-                output_devices.append(
-                    AudioDevice(
-                        id=device_id,
-                        name=name,
-                        channels=max_out,
-                        sample_rate=sample_rate,
-                    )
-                )
+        # One pass over the PortAudio dicts; both inventories are built from it.
+        prepped = [
+            (
+                str(index),
+                str(dev.get("name", f"device-{index}")),
+                int(dev.get("max_input_channels", 0)),
+                int(dev.get("max_output_channels", 0)),
+                dev.get("default_samplerate"),
+            )
+            for index, dev in enumerate(all_devices)
+        ]
+        input_devices = [
+            AudioDevice(id=device_id, name=name, channels=max_in, sample_rate=sample_rate)
+            for device_id, name, max_in, _, sample_rate in prepped
+            if max_in > 0
+        ]
+        output_devices = [
+            AudioDevice(id=device_id, name=name, channels=max_out, sample_rate=sample_rate)
+            for device_id, name, _, max_out, sample_rate in prepped
+            if max_out > 0
+        ]
 
         return AudioDevicesResponse(
             backend="sounddevice",
@@ -48,36 +81,5 @@ def enumerate_audio_devices() -> AudioDevicesResponse:
             default_input_device_id=str(default_input_id) if default_input_id is not None else None,
             default_output_device_id=str(default_output_id) if default_output_id is not None else None,
         )
-    except ModuleNotFoundError as exc:
-        if exc.name == "sounddevice":
-            return AudioDevicesResponse(
-                backend="none",
-                input_devices=[],
-                output_devices=[],
-                default_input_device_id=None,
-                default_output_device_id=None,
-                error="Audio device backend is not installed.",
-                error_code="missing_dependency",
-                hint="Install 'sounddevice' (pip install sounddevice) and restart the backend.",
-            )
-        return AudioDevicesResponse(
-            backend="none",
-            input_devices=[],
-            output_devices=[],
-            default_input_device_id=None,
-            default_output_device_id=None,
-            error=str(exc),
-            error_code="backend_error",
-            hint="Check runtime logs for details.",
-        )
     except Exception as exc:
-        return AudioDevicesResponse(
-            backend="none",
-            input_devices=[],
-            output_devices=[],
-            default_input_device_id=None,
-            default_output_device_id=None,
-            error=str(exc),
-            error_code="backend_error",
-            hint="Check runtime logs for details.",
-        )
+        return _backend_error_response(exc)
@@ -1,21 +1,21 @@
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 import logging
 import math
 from pathlib import Path
-from threading import Event, RLock, Thread
+from threading import Event, Lock, RLock, Thread
 import time
 from typing import TYPE_CHECKING, Any
 import wave
 
 import numpy as np
 
-from .adapters import ingest_asr_frame, synthesize_tts_signal
-from .format import compute_levels, convert_asr_ingress, resample_linear
-from .schemas import AudioMeterSnapshot, AudioRouteRecord
+from .adapters import ingest_asr_frames, synthesize_tts_signal
+from .format import compute_levels, convert_asr_ingress, resample_audio
+from .schemas import AudioRouteRecord
 
 if TYPE_CHECKING:
     from .state import AudioStateStore
@@ -25,6 +25,10 @@ LOGGER = logging.getLogger(__name__)
 DEFAULT_SAMPLE_RATE = 16000
 DEFAULT_CHANNELS = 1
 DEFAULT_BLOCKSIZE = 1024
+# Meter publications per second; UIs poll well below audio callback rate.
+DEFAULT_METER_HZ = 30.0
+# ASR windows a lagging capture worker hands to one batched adapter call.
+ASR_MAX_BATCH_WINDOWS = 8
 
 
 class AudioEngineRuntimeError(RuntimeError):
@@ -64,23 +68,175 @@ def _resolve_device(device_id: Any) -> int | str | None:
         return str(device_id)
 
 
-def _to_float32_mono(samples: np.ndarray) -> np.ndarray:
+def _to_float32_mono(samples: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
     data = np.asarray(samples, dtype=np.float32)
     if data.ndim == 2:
-        return data.mean(axis=1, dtype=np.float32)
+        if data.shape[1] == 1:
+            return data[:, 0]
+        if data.shape[1] == 2:
+            # Stereo is the common case: one add + scale instead of a generic
+            # axis-1 reduction. Bit-identical to mean() for two channels.
+            out = np.add(data[:, 0], data[:, 1], out=out)
+            return np.multiply(out, np.float32(0.5), out=out)
+        return data.mean(axis=1, dtype=np.float32, out=out)
     if data.ndim == 1:
         return data
     raise ValueError("Expected 1D or 2D sample data")
 
 
-def _to_pcm16_bytes(samples: np.ndarray, channels: int) -> bytes:
+@lru_cache(maxsize=1)
+def _load_soundfile() -> Any:
+    try:
+        import soundfile  # type: ignore
+    except (ImportError, OSError):
+        # OSError: the wheel is installed but libsndfile could not be loaded.
+        return None
+    return soundfile
+
+
+def _read_wav_mono(path: Path) -> tuple[np.ndarray, int]:
+    """
+    Decode a file_input source to float32 mono. libsndfile (via the optional
+    soundfile package) decodes and converts in C and also handles 24-bit and
+    float WAVs; without it, 16-bit PCM is read with the stdlib wave module.
+    """
+    soundfile = _load_soundfile()
+    if soundfile is not None:
+        data, src_rate = soundfile.read(str(path), dtype="float32", always_2d=True)
+        return _to_float32_mono(data), max(1, int(src_rate))
+
+    with wave.open(str(path), "rb") as handle:
+        src_channels = max(1, int(handle.getnchannels()))
+        src_rate = max(1, int(handle.getframerate()))
+        raw = handle.readframes(handle.getnframes())
+    ints = np.frombuffer(raw, dtype=np.int16)
+    if src_channels > 1 and ints.size >= src_channels:
+        # Sum channels in float32 (exact for int16) and scale once, so the
+        # downmix and the int16 -> float conversion share one output array.
+        frames = ints[: ints.size - ints.size % src_channels].reshape(-1, src_channels)
+        pcm = frames[:, 0].astype(np.float32)
+        for channel in range(1, src_channels):
+            np.add(pcm, frames[:, channel], out=pcm)
+        pcm /= np.float32(src_channels * 32767.0)
+    else:
+        pcm = np.divide(ints, np.float32(32767.0), dtype=np.float32)
+    return pcm, src_rate
+
+
+def _tone_signal(frequency_hz: float, amplitude: float, sample_rate: int, frame_count: int) -> np.ndarray:
+    """
+    amplitude * sin(2*pi*f*n/sr) by phase rotation: evaluate sin/cos for the
+    first block only, then fill each following span by rotating the samples
+    already computed (angle addition), one complex multiply per sample.
+    """
+    step = 2.0 * math.pi * frequency_hz / sample_rate
+    phasor = np.empty(frame_count, dtype=np.complex64)
+    filled = min(frame_count, 1024)
+    angles = np.arange(filled, dtype=np.float64) * step
+    phasor.real[:filled] = np.cos(angles)
+    phasor.imag[:filled] = np.sin(angles)
+    while filled < frame_count:
+        span = min(filled, frame_count - filled)
+        rotation = np.complex64(complex(math.cos(step * filled), math.sin(step * filled)))
+        np.multiply(phasor[:span], rotation, out=phasor[filled : filled + span])
+        filled += span
+    return np.multiply(phasor.imag, np.float32(amplitude))
+
+
+def _to_pcm16_bytes(
+    samples: np.ndarray,
+    channels: int,
+    runtime: "_RuntimeStream | None" = None,
+) -> memoryview:
+    # Returns a byte view of the int16 buffer rather than a bytes copy; with a
+    # runtime it aliases the stream's scratch and is only valid until the next
+    # call (wave's writeframes consumes it immediately).
     data = np.asarray(samples, dtype=np.float32)
-    if data.ndim == 1 and channels > 1:
-        data = np.repeat(data[:, None], channels, axis=1)
+    out_channels = channels if data.ndim == 1 and channels > 1 else 1
     if data.ndim == 1:
         data = data[:, None]
-    clipped = np.clip(data, -1.0, 1.0)
-    return (clipped * 32767.0).astype(np.int16).tobytes()
+    else:
+        out_channels = data.shape[1]
+    frames = data.shape[0]
+    if runtime is None:
+        scaled = np.empty(data.shape, dtype=np.float32)
+        pcm = np.empty((frames, out_channels), dtype=np.int16)
+    else:
+        scaled = runtime.scratch_buffer("pcm_scaled", data.shape)
+        pcm = runtime.scratch_buffer("pcm16", (frames, out_channels), np.int16)
+    # clip(x, -1, 1) * 32767 == clip(x * 32767, -32767, 32767); scale and clip in place,
+    # then truncate into int16 with the mono -> N channel repeat done by broadcasting.
+    np.multiply(data, np.float32(32767.0), out=scaled)
+    np.clip(scaled, -32767.0, 32767.0, out=scaled)
+    np.copyto(pcm, scaled, casting="unsafe")
+    if pcm.size == 0:
+        return memoryview(b"")
+    return memoryview(pcm).cast("B")
+
+
+class _SpscFrameRing:
+    """
+    Fixed-capacity frame queue between one audio callback (producer) and the
+    API readers (consumer). Frames are copied into preallocated float32 slabs;
+    only the producer advances `_tail` and only the consumer advances `_head`,
+    so push() never blocks. Like a bounded deque, once full the oldest frames
+    are dropped.
+    """
+
+    def __init__(self, capacity: int, frame_len: int):
+        # One spare slot: the slot the producer will write next is never read.
+        self._slots = capacity + 1
+        self._buf = np.zeros((self._slots, max(1, frame_len)), dtype=np.float32)
+        self._lengths = np.zeros(self._slots, dtype=np.intp)
+        self._head = 0
+        self._tail = 0
+        self._consumer_lock = Lock()
+
+    def push(self, samples: np.ndarray) -> None:
+        frame = np.asarray(samples, dtype=np.float32).reshape(-1)
+        size = frame.size
+        buf = self._buf
+        if size > buf.shape[1]:
+            # Rare (block size changed): widen off to the side, then swap in.
+            wider = np.zeros((self._slots, size), dtype=np.float32)
+            wider[:, : buf.shape[1]] = buf
+            self._buf = buf = wider
+        slot = self._tail % self._slots
+        self._lengths[slot] = size
+        np.copyto(buf[slot, :size], frame)
+        self._tail += 1
+
+    def pop(self) -> np.ndarray | None:
+        with self._consumer_lock:
+            while True:
+                tail = self._tail
+                head = max(self._head, tail - self._slots + 1)
+                if head >= tail:
+                    self._head = head
+                    return None
+                slot = head % self._slots
+                frame = self._buf[slot, : int(self._lengths[slot])].copy()
+                if self._tail - head >= self._slots:
+                    # The producer lapped this slot while it was copied.
+                    self._head = head + 1
+                    continue
+                self._head = head + 1
+                return frame
+
+
+def _sleep_until_next_block(deadline: float, frame_seconds: float) -> float:
+    """
+    Pace worker loops against a monotonic schedule so per-block work does not
+    add up as drift. Returns the next deadline; if the loop has fallen more
+    than two blocks behind, the schedule restarts from now instead of bursting.
+    """
+    deadline += frame_seconds
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    elif delay < -2.0 * frame_seconds:
+        deadline = time.monotonic()
+    return deadline
 
 
 @dataclass
@@ -103,10 +259,33 @@ class _RuntimeStream:
     file_writer: wave.Wave_write | None = None
     signal: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
     signal_cursor: int = 0
+    # `signal` looped past its end by at least one read, so chunks are plain slices.
+    padded_signal: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    # max |signal|, known once the padded loop is built.
+    signal_peak: float | None = None
+    # Per-stream buffers reused across callbacks (controls output, meter mono mix,
+    # PCM packing), keyed by purpose. See scratch_buffer().
+    scratch: dict[str, np.ndarray] = field(default_factory=dict)
     asr_dispatch_counter: int = 0
     asr_dispatch_interval: int = 8
+    meter_interval_seconds: float = 1.0 / DEFAULT_METER_HZ
+    last_meter_monotonic: float = 0.0
+    # 16 kHz ingress frames accumulated between adapter dispatches.
+    asr_pending: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    asr_pending_size: int = 0
     active: bool = False
 
+    def scratch_buffer(self, name: str, shape: tuple[int, ...], dtype: Any = np.float32) -> np.ndarray:
+        """
+        Return the reusable buffer `name`, reallocated only when the callback's
+        block shape changes. Contents are overwritten by the next callback.
+        """
+        buffer = self.scratch.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self.scratch[name] = buffer
+        return buffer
+
 
 class AudioEngine:
     """
@@ -115,12 +294,17 @@ class AudioEngine:
     """
 
     def __init__(self):
+        # Guards stream lifecycle (start/pause/stop/shutdown). The per-stream ASR
+        # rings and adapter result dicts below are written from audio callbacks
+        # without it (SPSC ring / single dict assignment).
         self._lock = RLock()
         self._running = False
         self._streams: dict[str, _RuntimeStream] = {}
-        self._asr_buffers: dict[str, deque[np.ndarray]] = {}
+        self._asr_buffers: dict[str, _SpscFrameRing] = {}
         self._last_asr_adapter_result: dict[str, dict[str, object]] = {}
         self._last_tts_adapter_result: dict[str, dict[str, object]] = {}
+        # stream_id -> (controls version, linear gain, muted), resolved off the hot path.
+        self._control_cache: dict[str, tuple[int, float, bool]] = {}
 
     @property
     def is_running(self) -> bool:
@@ -155,23 +339,28 @@ class AudioEngine:
             self._running = False
 
     def read_asr_frames(self, stream_id: str, *, max_frames: int = 1) -> list[np.ndarray]:
-        with self._lock:
-            buffer = self._asr_buffers.get(stream_id)
-            if buffer is None:
-                return []
-            out: list[np.ndarray] = []
-            for _ in range(max(0, max_frames)):
-                if not buffer:
-                    break
-                out.append(buffer.popleft())
-            return out
+        # No engine lock: the rings are single-producer/single-consumer, so
+        # readers never stall the audio thread.
+        buffer = self._asr_buffers.get(stream_id)
+        if buffer is None:
+            return []
+        out: list[np.ndarray] = []
+        for _ in range(max(0, max_frames)):
+            frame = buffer.pop()
+            if frame is None:
+                break
+            out.append(frame)
+        return out
 
     def get_adapter_diagnostics(self) -> dict[str, dict[str, dict[str, object]]]:
-        with self._lock:
-            return {
-                "asr": {stream_id: dict(payload) for stream_id, payload in self._last_asr_adapter_result.items()},
-                "tts": {stream_id: dict(payload) for stream_id, payload in self._last_tts_adapter_result.items()},
-            }
+        # Callbacks publish results by plain key assignment; list() snapshots
+        # the items atomically so a concurrent insert cannot break iteration.
+        asr = list(self._last_asr_adapter_result.items())
+        tts = list(self._last_tts_adapter_result.items())
+        return {
+            "asr": {stream_id: dict(payload) for stream_id, payload in asr},
+            "tts": {stream_id: dict(payload) for stream_id, payload in tts},
+        }
 
     def start_stream(self, stream_id: str, *, state_store: AudioStateStore) -> bool:
         with self._lock:
@@ -231,10 +420,12 @@ class AudioEngine:
             runtime = self._streams.pop(stream_id, None)
             if runtime is None:
                 return False
+            self._close_runtime_unlocked(runtime)
+            # Only after the worker is joined: a capture worker drains its ring
+            # on stop and would otherwise republish ASR diagnostics.
             self._asr_buffers.pop(stream_id, None)
             self._last_asr_adapter_result.pop(stream_id, None)
             self._last_tts_adapter_result.pop(stream_id, None)
-            self._close_runtime_unlocked(runtime)
             self._refresh_running_flag_unlocked()
             return True
 
@@ -282,9 +473,14 @@ class AudioEngine:
             source_config.get("blocksize", sink_config.get("blocksize", DEFAULT_BLOCKSIZE)),
             DEFAULT_BLOCKSIZE,
         )
+        meter_hz = _as_float(
+            source_config.get("meter_hz", sink_config.get("meter_hz", DEFAULT_METER_HZ)),
+            DEFAULT_METER_HZ,
+            minimum=1.0,
+        )
 
         if route.source.kind in {"mic", "loopback"}:
-            return self._build_capture_runtime_unlocked(
+            runtime = self._build_capture_runtime_unlocked(
                 stream_id=stream_id,
                 route=route,
                 sample_rate=sample_rate,
@@ -294,16 +490,18 @@ class AudioEngine:
                 default_output_device_id=default_output_device_id,
                 state_store=state_store,
             )
-
-        return self._build_playback_runtime_unlocked(
-            stream_id=stream_id,
-            route=route,
-            sample_rate=sample_rate,
-            channels=channels,
-            blocksize=blocksize,
-            default_output_device_id=default_output_device_id,
-            state_store=state_store,
-        )
+        else:
+            runtime = self._build_playback_runtime_unlocked(
+                stream_id=stream_id,
+                route=route,
+                sample_rate=sample_rate,
+                channels=channels,
+                blocksize=blocksize,
+                default_output_device_id=default_output_device_id,
+                state_store=state_store,
+            )
+        runtime.meter_interval_seconds = 1.0 / meter_hz
+        return runtime
 
     def _build_capture_runtime_unlocked(
         self,
@@ -347,7 +545,25 @@ class AudioEngine:
         needs_asr_conversion = route.sink.kind == "asr" or any(
             proc.kind == "asr_ingress" for proc in route.processors
         )
-        self._asr_buffers[stream_id] = deque(maxlen=64)
+        self._asr_buffers[stream_id] = _SpscFrameRing(64, math.ceil(blocksize * 16000 / sample_rate))
+        # Callbacks only apply controls (and fill outdata) and push the block
+        # here; ASR conversion/dispatch, file writes and meters run on a worker.
+        postproc_ring = _SpscFrameRing(64, blocksize * channels)
+        worker = _WorkerHandle(thread=Thread(target=lambda: None))
+        worker.thread = Thread(
+            target=self._capture_postproc_worker_loop,
+            kwargs={
+                "runtime": runtime,
+                "ring": postproc_ring,
+                "state_store": state_store,
+                "worker": worker,
+                "needs_asr_conversion": needs_asr_conversion,
+            },
+            name=f"audio-capture-worker-{stream_id}",
+            daemon=True,
+        )
+        worker.thread.start()
+        runtime.worker = worker
         try:
             if route.sink.kind in {"speakers", "virtual_output"}:
                 runtime.backend = "sounddevice_duplex_passthrough"
@@ -357,27 +573,16 @@ class AudioEngine:
                     if status:
                         LOGGER.debug("Audio duplex callback status for %s: %s", stream_id, status)
                     samples = np.asarray(indata, dtype=np.float32)
-                    processed = self._apply_stream_controls_unlocked(stream_id, samples, state_store)
+                    processed = self._apply_stream_controls_unlocked(runtime, samples, state_store)
                     out = processed
                     if out.ndim == 1:
                         out = out[:, None]
-                    if out.shape[1] != channels:
-                        out = np.repeat(_to_float32_mono(out)[:, None], channels, axis=1)
+                    elif out.shape[1] != channels:
+                        mono = runtime.scratch_buffer("duplex_mono", (out.shape[0],))
+                        out = _to_float32_mono(out, out=mono)[:, None]
+                    # A single column broadcasts across every output channel.
                     outdata[:] = out[:frames]
-
-                    if needs_asr_conversion:
-                        converted, _ = self.process_asr_ingress(
-                            processed,
-                            sample_rate=sample_rate,
-                            channels=channels,
-                        )
-                        ingress_buffer = self._asr_buffers.get(stream_id)
-                        if ingress_buffer is not None:
-                            ingress_buffer.append(np.asarray(converted, dtype=np.float32))
-                        self._maybe_dispatch_asr_adapter(runtime, converted)
-
-                    self._write_optional_file_chunk_unlocked(runtime, processed)
-                    self._publish_meter_unlocked(stream_id, processed, state_store)
+                    postproc_ring.push(processed)
 
                 stream = sd.Stream(
                     samplerate=sample_rate,
@@ -396,21 +601,8 @@ class AudioEngine:
                 if status:
                     LOGGER.debug("Audio capture callback status for %s: %s", stream_id, status)
                 samples = np.asarray(indata, dtype=np.float32)
-                processed = self._apply_stream_controls_unlocked(stream_id, samples, state_store)
-
-                if needs_asr_conversion:
-                    converted, _ = self.process_asr_ingress(
-                        processed,
-                        sample_rate=sample_rate,
-                        channels=channels,
-                    )
-                    ingress_buffer = self._asr_buffers.get(stream_id)
-                    if ingress_buffer is not None:
-                        ingress_buffer.append(np.asarray(converted, dtype=np.float32))
-                    self._maybe_dispatch_asr_adapter(runtime, converted)
-
-                self._write_optional_file_chunk_unlocked(runtime, processed)
-                self._publish_meter_unlocked(stream_id, processed, state_store)
+                processed = self._apply_stream_controls_unlocked(runtime, samples, state_store)
+                postproc_ring.push(processed)
 
             stream = sd.InputStream(
                 samplerate=sample_rate,
@@ -424,6 +616,9 @@ class AudioEngine:
             runtime.stream = stream
             return runtime
         except Exception:
+            worker.stop_event.set()
+            worker.thread.join(timeout=1.0)
+            runtime.worker = None
             if runtime.file_writer is not None:
                 runtime.file_writer.close()
                 runtime.file_writer = None
@@ -480,7 +675,7 @@ class AudioEngine:
                 return runtime
 
             if route.sink.kind == "asr":
-                self._asr_buffers[stream_id] = deque(maxlen=64)
+                self._asr_buffers[stream_id] = _SpscFrameRing(64, math.ceil(blocksize * 16000 / sample_rate))
                 worker = _WorkerHandle(thread=Thread(target=lambda: None))
                 worker.thread = Thread(
                     target=self._asr_ingress_worker_loop,
@@ -517,13 +712,9 @@ class AudioEngine:
                 if status:
                     LOGGER.debug("Audio output callback status for %s: %s", stream_id, status)
                 chunk = self._next_signal_chunk_unlocked(runtime, frames)
-                chunk = self._apply_stream_controls_unlocked(stream_id, chunk, state_store)
-                if channels > 1:
-                    out = np.repeat(chunk[:, None], channels, axis=1)
-                else:
-                    out = chunk[:, None]
-                outdata[:] = out
-                self._publish_meter_unlocked(stream_id, chunk, state_store)
+                chunk = self._apply_stream_controls_unlocked(runtime, chunk, state_store, peak=runtime.signal_peak)
+                outdata[:] = chunk[:, None]
+                self._publish_meter_unlocked(runtime, chunk, state_store)
 
             stream = sd.OutputStream(
                 samplerate=sample_rate,
@@ -558,6 +749,55 @@ class AudioEngine:
             self._asr_buffers.pop(stream_id, None)
             raise
 
+    def _capture_postproc_worker_loop(
+        self,
+        *,
+        runtime: _RuntimeStream,
+        ring: _SpscFrameRing,
+        state_store: AudioStateStore,
+        worker: _WorkerHandle,
+        needs_asr_conversion: bool,
+    ) -> None:
+        idle_seconds = runtime.blocksize / float(runtime.sample_rate) / 2.0
+        # ASR windows completed while blocks are still queued. When the worker
+        # lags, they go to the adapter together as one batched session run.
+        windows: list[np.ndarray] = []
+        while True:
+            flat = ring.pop()
+            if flat is None or len(windows) >= ASR_MAX_BATCH_WINDOWS:
+                if windows:
+                    try:
+                        self._dispatch_asr_windows(runtime, windows)
+                    except Exception:
+                        LOGGER.debug("ASR dispatch failed for %s", runtime.stream_id, exc_info=True)
+                    windows = []
+                if flat is None:
+                    # Drain whatever the callback pushed before exiting.
+                    if worker.stop_event.is_set():
+                        return
+                    worker.stop_event.wait(idle_seconds)
+                    continue
+            processed = flat.reshape(-1, runtime.channels)
+            try:
+                if needs_asr_conversion:
+                    converted, _ = self.process_asr_ingress(
+                        processed,
+                        sample_rate=runtime.sample_rate,
+                        channels=runtime.channels,
+                    )
+                    ingress_buffer = self._asr_buffers.get(runtime.stream_id)
+                    if ingress_buffer is not None:
+                        ingress_buffer.push(converted)
+                    window = self._collect_asr_window(runtime, converted)
+                    if window is not None:
+                        # The pending buffer is reused for the next window.
+                        windows.append(window.copy())
+
+                self._write_optional_file_chunk_unlocked(runtime, processed)
+                self._publish_meter_unlocked(runtime, processed, state_store)
+            except Exception:
+                LOGGER.debug("Audio post-processing failed for %s", runtime.stream_id, exc_info=True)
+
     def _file_playback_worker_loop(
         self,
         *,
@@ -566,15 +806,17 @@ class AudioEngine:
         worker: _WorkerHandle,
     ) -> None:
         frame_seconds = runtime.blocksize / float(runtime.sample_rate)
+        deadline = time.monotonic()
         while not worker.stop_event.is_set():
             if worker.pause_event.is_set():
                 time.sleep(0.05)
+                deadline = time.monotonic()
                 continue
             chunk = self._next_signal_chunk_unlocked(runtime, runtime.blocksize)
-            chunk = self._apply_stream_controls_unlocked(runtime.stream_id, chunk, state_store)
+            chunk = self._apply_stream_controls_unlocked(runtime, chunk, state_store, peak=runtime.signal_peak)
             self._write_optional_file_chunk_unlocked(runtime, chunk)
-            self._publish_meter_unlocked(runtime.stream_id, chunk, state_store)
-            time.sleep(frame_seconds)
+            self._publish_meter_unlocked(runtime, chunk, state_store)
+            deadline = _sleep_until_next_block(deadline, frame_seconds)
 
     def _asr_ingress_worker_loop(
         self,
@@ -584,12 +826,14 @@ class AudioEngine:
         worker: _WorkerHandle,
     ) -> None:
         frame_seconds = runtime.blocksize / float(runtime.sample_rate)
+        deadline = time.monotonic()
         while not worker.stop_event.is_set():
             if worker.pause_event.is_set():
                 time.sleep(0.05)
+                deadline = time.monotonic()
                 continue
             chunk = self._next_signal_chunk_unlocked(runtime, runtime.blocksize)
-            chunk = self._apply_stream_controls_unlocked(runtime.stream_id, chunk, state_store)
+            chunk = self._apply_stream_controls_unlocked(runtime, chunk, state_store, peak=runtime.signal_peak)
             converted, _ = self.process_asr_ingress(
                 chunk,
                 sample_rate=runtime.sample_rate,
@@ -597,10 +841,10 @@ class AudioEngine:
             )
             ingress_buffer = self._asr_buffers.get(runtime.stream_id)
             if ingress_buffer is not None:
-                ingress_buffer.append(np.asarray(converted, dtype=np.float32))
+                ingress_buffer.push(converted)
             self._maybe_dispatch_asr_adapter(runtime, converted)
-            self._publish_meter_unlocked(runtime.stream_id, chunk, state_store)
-            time.sleep(frame_seconds)
+            self._publish_meter_unlocked(runtime, chunk, state_store)
+            deadline = _sleep_until_next_block(deadline, frame_seconds)
 
     def _materialize_playback_signal_unlocked(self, *, route: AudioRouteRecord, sample_rate: int) -> np.ndarray:
         source_config = route.source.config or {}
@@ -627,15 +871,9 @@ class AudioEngine:
             path = Path(str(path_value))
             if not path.exists():
                 raise AudioEngineRuntimeError(f"file_input source path does not exist: {path}")
-            with wave.open(str(path), "rb") as handle:
-                src_channels = max(1, int(handle.getnchannels()))
-                src_rate = max(1, int(handle.getframerate()))
-                raw = handle.readframes(handle.getnframes())
-            pcm = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32767.0
-            if src_channels > 1 and pcm.size >= src_channels:
-                pcm = pcm.reshape(-1, src_channels).mean(axis=1, dtype=np.float32)
+            pcm, src_rate = _read_wav_mono(path)
             if src_rate != sample_rate:
-                pcm = resample_linear(pcm, src_rate, sample_rate)
+                pcm = resample_audio(pcm, src_rate, sample_rate)
             return pcm.astype(np.float32, copy=False)
 
         raw_samples = source_config.get("samples")
@@ -646,25 +884,34 @@ class AudioEngine:
         amplitude = _as_float(source_config.get("amplitude"), 0.2, minimum=0.0)
         duration_seconds = _as_float(source_config.get("duration_seconds"), 1.0, minimum=0.1)
         frame_count = max(1, int(round(duration_seconds * sample_rate)))
-        t = np.arange(frame_count, dtype=np.float32) / float(sample_rate)
-        return (amplitude * np.sin(2.0 * math.pi * frequency_hz * t)).astype(np.float32)
+        return _tone_signal(frequency_hz, amplitude, sample_rate, frame_count)
 
     def _next_signal_chunk_unlocked(self, runtime: _RuntimeStream, frames: int) -> np.ndarray:
+        # Hot path once the loop is built: one slice and one cursor store.
+        padded = runtime.padded_signal
+        cursor = runtime.signal_cursor
+        end = cursor + frames
+        if cursor < end <= padded.size:
+            runtime.signal_cursor = end % runtime.signal.size
+            return padded[cursor:end]
+
         signal = runtime.signal
         if signal.size == 0:
             return np.zeros(frames, dtype=np.float32)
-        out = np.empty(frames, dtype=np.float32)
-        cursor = runtime.signal_cursor
-        signal_len = signal.size
-        filled = 0
-        while filled < frames:
-            remaining = frames - filled
-            take = min(remaining, signal_len - cursor)
-            out[filled : filled + take] = signal[cursor : cursor + take]
-            filled += take
-            cursor = (cursor + take) % signal_len
-        runtime.signal_cursor = cursor
-        return out
+        period = signal.size
+        if padded.size < period + frames:
+            # np.resize repeats the signal cyclically; built once per stream (or
+            # when a callback asks for more frames than before).
+            padded = np.resize(signal, period + frames)
+            padded.flags.writeable = False
+            if runtime.signal_peak is None:
+                runtime.signal_peak = float(max(signal.max(), -signal.min()))
+            runtime.padded_signal = padded
+            # Keep a single copy of long file/TTS signals around.
+            runtime.signal = padded[:period]
+        runtime.signal_cursor = end % period
+        # Read-only view into the padded loop; callers must not write to it.
+        return padded[cursor:end]
 
     def _open_optional_sink_file_unlocked(
         self,
@@ -693,24 +940,58 @@ class AudioEngine:
         if runtime.file_writer is None:
             return
         try:
-            runtime.file_writer.writeframes(_to_pcm16_bytes(samples, runtime.channels))
+            runtime.file_writer.writeframes(_to_pcm16_bytes(samples, runtime.channels, runtime))
         except Exception:
             LOGGER.debug("Audio file write failed for %s", runtime.stream_id, exc_info=True)
 
+    def _resolve_stream_control(self, stream_id: str, state_store: AudioStateStore) -> tuple[float, bool]:
+        version = state_store.control_version()
+        cached = self._control_cache.get(stream_id)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+        control = state_store.get_control(stream_id)
+        gain = float(10 ** (control.gain_db / 20.0)) if control.gain_db else 1.0
+        self._control_cache[stream_id] = (version, gain, control.muted)
+        return gain, control.muted
+
     def _apply_stream_controls_unlocked(
         self,
-        stream_id: str,
+        runtime: _RuntimeStream,
         samples: np.ndarray,
         state_store: AudioStateStore,
+        *,
+        peak: float | None = None,
     ) -> np.ndarray:
-        control = state_store.get_control(stream_id)
+        """
+        Apply gain/mute and clip to [-1, 1]. `peak`, when known (playback
+        signals), bounds |samples| and lets in-range blocks skip the clip.
+        The input may be a read-only signal view or the backend's indata and is
+        never modified; results go to the stream's "processed" buffer, or are
+        the input itself when there is nothing to do.
+        """
+        gain, muted = self._resolve_stream_control(runtime.stream_id, state_store)
         data = np.asarray(samples, dtype=np.float32)
-        if control.muted:
-            return np.zeros_like(data, dtype=np.float32)
-        if control.gain_db:
-            gain = float(10 ** (control.gain_db / 20.0))
-            data = data * gain
-        return np.clip(data, -1.0, 1.0)
+        if muted:
+            # Zeroed once per block shape and kept read-only, so a long-muted
+            # stream costs no array work at all.
+            silence = runtime.scratch.get("silence")
+            if silence is None or silence.shape != data.shape:
+                silence = np.zeros(data.shape, dtype=np.float32)
+                silence.flags.writeable = False
+                runtime.scratch["silence"] = silence
+            return silence
+        # Leave float32 rounding headroom when scaling; unity gain is exact.
+        in_range = peak is not None and (peak <= 1.0 if gain == 1.0 else peak * gain < 0.9999)
+        if gain == 1.0:
+            if in_range:
+                return data
+            out = runtime.scratch_buffer("processed", data.shape)
+            return np.clip(data, -1.0, 1.0, out=out)
+        out = runtime.scratch_buffer("processed", data.shape)
+        np.multiply(data, gain, out=out)
+        if in_range:
+            return out
+        return np.clip(out, -1.0, 1.0, out=out)
 
     @staticmethod
     def _route_has_asr_ingress(route: AudioRouteRecord) -> bool:
@@ -730,36 +1011,63 @@ class AudioEngine:
         return None
 
     def _maybe_dispatch_asr_adapter(self, runtime: _RuntimeStream, converted_samples: np.ndarray) -> None:
+        window = self._collect_asr_window(runtime, converted_samples)
+        if window is not None:
+            self._dispatch_asr_windows(runtime, [window])
+
+    def _collect_asr_window(self, runtime: _RuntimeStream, converted_samples: np.ndarray) -> np.ndarray | None:
+        """
+        Append a converted block to the stream's pending ASR window. Returns the
+        window once it is complete; it is a view of runtime.asr_pending, so it is
+        only valid until the next block is collected.
+        """
         if not self._route_has_asr_ingress(runtime.route):
-            return
+            return None
+
+        # Collect the whole dispatch window and hand it to the adapter in one
+        # call, instead of sending only every N-th frame.
+        frame = np.asarray(converted_samples, dtype=np.float32).reshape(-1)
+        start = runtime.asr_pending_size
+        end = start + frame.size
+        pending = runtime.asr_pending
+        if end > pending.size:
+            grown = np.empty(max(end, runtime.asr_dispatch_interval * frame.size), dtype=np.float32)
+            grown[:start] = pending[:start]
+            runtime.asr_pending = pending = grown
+        pending[start:end] = frame
+        runtime.asr_pending_size = end
 
         runtime.asr_dispatch_counter += 1
         if runtime.asr_dispatch_counter % runtime.asr_dispatch_interval != 0:
-            return
+            return None
+
+        runtime.asr_pending_size = 0
+        return pending[:end]
 
-        result = ingest_asr_frame(
-            np.asarray(converted_samples, dtype=np.float32),
+    def _dispatch_asr_windows(self, runtime: _RuntimeStream, windows: list[np.ndarray]) -> None:
+        results = ingest_asr_frames(
+            windows,
             model_id=self._resolve_asr_model_id(runtime.route),
         )
-        with self._lock:
-            self._last_asr_adapter_result[runtime.stream_id] = result
+        # Published by a single dict assignment from the audio thread; no lock.
+        self._last_asr_adapter_result[runtime.stream_id] = results[-1]
 
     def _publish_meter_unlocked(
         self,
-        stream_id: str,
+        runtime: _RuntimeStream,
         samples: np.ndarray,
         state_store: AudioStateStore,
     ) -> None:
-        peak, rms, clipped = compute_levels(_to_float32_mono(np.asarray(samples, dtype=np.float32)))
-        state_store.upsert_meter(
-            AudioMeterSnapshot(
-                stream_id=stream_id,
-                peak=peak,
-                rms=rms,
-                clipped=clipped,
-                updated_at_utc=_utc_now(),
-            )
-        )
+        now = time.monotonic()
+        if now - runtime.last_meter_monotonic < runtime.meter_interval_seconds:
+            return
+        runtime.last_meter_monotonic = now
+        data = np.asarray(samples, dtype=np.float32)
+        mono = None
+        if data.ndim == 2 and data.shape[1] > 1:
+            mono = runtime.scratch_buffer("meter_mono", (data.shape[0],))
+        peak, rms, clipped = compute_levels(_to_float32_mono(data, out=mono))
+        state_store.publish_meter_levels(runtime.stream_id, peak, rms, clipped)
 
     def _resume_runtime_unlocked(self, runtime: _RuntimeStream) -> None:
         if runtime.stream is not None:
@@ -769,11 +1077,8 @@ class AudioEngine:
         runtime.active = True
 
     def _close_runtime_unlocked(self, runtime: _RuntimeStream) -> None:
-        if runtime.worker is not None:
-            runtime.worker.stop_event.set()
-            runtime.worker.pause_event.clear()
-            runtime.worker.thread.join(timeout=1.5)
-            runtime.worker = None
+        # Stop the device stream first so a capture worker can drain the last
+        # blocks its callback pushed before the file sink is closed.
         if runtime.stream is not None:
             try:
                 runtime.stream.stop()
@@ -784,6 +1089,11 @@ class AudioEngine:
             except Exception:
                 LOGGER.debug("Audio stream close raised for %s", runtime.stream_id, exc_info=True)
             runtime.stream = None
+        if runtime.worker is not None:
+            runtime.worker.stop_event.set()
+            runtime.worker.pause_event.clear()
+            runtime.worker.thread.join(timeout=1.5)
+            runtime.worker = None
         if runtime.file_writer is not None:
             try:
                 runtime.file_writer.close()
@@ -791,6 +1101,7 @@ class AudioEngine:
                 LOGGER.debug("Audio file close raised for %s", runtime.stream_id, exc_info=True)
             runtime.file_writer = None
         runtime.active = False
+        self._control_cache.pop(runtime.stream_id, None)
 
     def _refresh_running_flag_unlocked(self) -> None:
         self._running = any(runtime.active for runtime in self._streams.values())
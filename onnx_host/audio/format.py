@@ -1,3 +1,6 @@
+import math
+from functools import lru_cache
+
 import numpy as np
 
 
@@ -5,6 +8,18 @@ def _as_float32(samples) -> np.ndarray:
     return np.asarray(samples, dtype=np.float32)
 
 
+def _downmix(frames: np.ndarray) -> np.ndarray:
+    channels = frames.shape[1]
+    if channels == 1:
+        return frames[:, 0]
+    if channels == 2:
+        # (L + R) * 0.5 over the two strided columns; same result as mean().
+        mono = np.add(frames[:, 0], frames[:, 1])
+        mono *= np.float32(0.5)
+        return mono
+    return frames.mean(axis=1, dtype=np.float32)
+
+
 def to_mono(samples, channels: int | None = None) -> np.ndarray:
     """
     Collapse audio to mono.
@@ -12,11 +27,11 @@ def to_mono(samples, channels: int | None = None) -> np.ndarray:
     """
     data = _as_float32(samples)
     if data.ndim == 2:
-        return data.mean(axis=1, dtype=np.float32)
+        return _downmix(data)
 
     if data.ndim == 1:
         if channels and channels > 1 and data.size >= channels and data.size % channels == 0:
-            return data.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+            return _downmix(data.reshape(-1, channels))
         return data
 
     raise ValueError("Audio samples must be 1D or 2D")
@@ -31,9 +46,120 @@ def resample_linear(samples: np.ndarray, src_rate: int, dst_rate: int) -> np.nda
     duration_seconds = samples.size / float(src_rate)
     target_length = max(1, int(round(duration_seconds * dst_rate)))
 
-    old_index = np.linspace(0.0, 1.0, num=samples.size, endpoint=False, dtype=np.float32)
-    new_index = np.linspace(0.0, 1.0, num=target_length, endpoint=False, dtype=np.float32)
-    return np.interp(new_index, old_index, samples).astype(np.float32)
+    # Output sample j sits at source index j * n / target_length; the source
+    # grid is just 0..n-1, cached per block length.
+    positions = np.arange(target_length, dtype=np.float64)
+    positions *= samples.size / target_length
+    return np.interp(positions, _source_grid(samples.size), samples).astype(np.float32)
+
+
+@lru_cache(maxsize=8)
+def _source_grid(size: int) -> np.ndarray:
+    grid = np.arange(size, dtype=np.float64)
+    grid.flags.writeable = False
+    return grid
+
+
+def resample_hermite(samples: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """
+    4-point cubic Hermite (Catmull-Rom) resampling: same output grid as
+    resample_linear, noticeably less aliasing, all elementwise float32 ufuncs.
+    """
+    if src_rate <= 0 or dst_rate <= 0:
+        raise ValueError("Sample rates must be positive")
+    data = _as_float32(samples).reshape(-1)
+    if data.size < 2 or src_rate == dst_rate:
+        return resample_linear(data, src_rate, dst_rate)
+
+    target_length = max(1, int(round(data.size / float(src_rate) * dst_rate)))
+    positions = np.arange(target_length, dtype=np.float64) * (data.size / target_length)
+    index = positions.astype(np.intp)
+    mu = (positions - index).astype(np.float32)
+
+    last = data.size - 1
+    y0 = data.take(index - 1, mode="clip")
+    y1 = data.take(index, mode="clip")
+    y2 = data.take(np.minimum(index + 1, last))
+    y3 = data.take(np.minimum(index + 2, last))
+
+    # Horner form: ((c3*mu + c2)*mu + c1)*mu + y1
+    c1 = y2 - y0
+    c1 *= 0.5
+    c3 = y1 - y2
+    c3 *= 1.5
+    c3 += (y3 - y0) * np.float32(0.5)
+    c2 = y0 - y1
+    c2 += c1
+    c2 -= c3
+    out = c3 * mu
+    out += c2
+    out *= mu
+    out += c1
+    out *= mu
+    out += y1
+    return out
+
+
+@lru_cache(maxsize=1)
+def _load_polyphase():
+    """scipy's polyphase FIR primitives, if scipy is installed (it is optional)."""
+    try:
+        from scipy.signal import firwin, upfirdn  # type: ignore
+    except ImportError:
+        return None
+    return firwin, upfirdn
+
+
+@lru_cache(maxsize=32)
+def _polyphase_plan(up: int, down: int, n_in: int) -> tuple[np.ndarray, int, int]:
+    """
+    What scipy's resample_poly(..., padtype="line") works out on every call,
+    built once per ratio and block length: the default Kaiser anti-aliasing
+    filter scaled by `up` and zero-padded to centre the output, the number of
+    leading outputs to drop, and the output length. ASR ingress repeats the
+    same (48000 -> 16000, blocksize) case for every block.
+    """
+    firwin, _ = _load_polyphase()
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    # float32 before scaling, as resample_poly matches the filter to the samples' dtype.
+    taps = firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0)).astype(np.float32)
+    taps *= up
+
+    n_out = -(-n_in * up // down)
+    n_pre_pad = down - half_len % down
+    n_pre_remove = (half_len + n_pre_pad) // down
+    n_post_pad = 0
+    while ((n_in - 1) * up + taps.size + n_pre_pad + n_post_pad - 1) // down + 1 < n_out + n_pre_remove:
+        n_post_pad += 1
+    taps = np.concatenate((np.zeros(n_pre_pad, np.float32), taps, np.zeros(n_post_pad, np.float32)))
+    taps.flags.writeable = False
+    return taps, n_pre_remove, n_out
+
+
+def resample_audio(samples: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """
+    Resample with a polyphase FIR (anti-aliased) when scipy is available and
+    fall back to resample_hermite otherwise. Used for file_input sources and for
+    ASR ingress blocks; edges are extended linearly so per-block filtering does
+    not pull block boundaries toward zero.
+    """
+    if src_rate <= 0 or dst_rate <= 0:
+        raise ValueError("Sample rates must be positive")
+    if samples.size == 0 or src_rate == dst_rate:
+        return resample_linear(samples, src_rate, dst_rate)
+    if samples.size < 2 or _load_polyphase() is None:
+        # A single sample has no slope for the "line" edge extension (scipy
+        # returns NaN); resample_hermite holds it instead.
+        return resample_hermite(samples, src_rate, dst_rate)
+
+    _, upfirdn = _load_polyphase()
+    samples = _as_float32(samples)
+    g = math.gcd(src_rate, dst_rate)
+    up, down = dst_rate // g, src_rate // g
+    taps, start, n_out = _polyphase_plan(up, down, samples.size)
+    out = upfirdn(taps, samples, up, down, mode="line")[start : start + n_out]
+    return out.astype(np.float32, copy=False)
 
 
 def convert_asr_ingress(
@@ -47,7 +173,7 @@ def convert_asr_ingress(
     Enforce the ASR boundary rule: convert to 16k mono only at ASR ingress.
     """
     mono = to_mono(samples, channels=channels)
-    return resample_linear(mono, src_rate=sample_rate, dst_rate=target_sample_rate)
+    return resample_audio(mono, sample_rate, target_sample_rate)
 
 
 def compute_levels(samples) -> tuple[float, float, bool]:
@@ -55,8 +181,10 @@ def compute_levels(samples) -> tuple[float, float, bool]:
     if data.size == 0:
         return 0.0, 0.0, False
 
-    abs_data = np.abs(data)
-    peak = float(np.max(abs_data))
-    rms = float(np.sqrt(np.mean(np.square(data))))
+    # Meters run on every audio callback: take the peak from max/min and the
+    # energy from one BLAS dot product instead of materializing |x| and x**2.
+    flat = data.reshape(-1)
+    peak = float(max(flat.max(), -flat.min()))
+    rms = float(np.sqrt(np.dot(flat, flat) / flat.size))
     clipped = peak >= 1.0
     return peak, rms, clipped
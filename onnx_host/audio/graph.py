@@ -9,6 +9,10 @@ from .schemas import (
 )
 
 
+_CAPTURE_SOURCE_KINDS = frozenset({"mic", "loopback"})
+_PLAYBACK_SINK_KINDS = frozenset({"speakers", "virtual_output", "file"})
+
+
 class AudioRouteValidationError(ValueError):
     pass
 
@@ -41,8 +45,8 @@ def materialize_route(route: AudioRouteUpsertRequest) -> AudioRouteRecord:
 
 
 def infer_route_direction(route: AudioRouteRecord) -> str:
-    has_capture_source = route.source.kind in {"mic", "loopback"}
-    has_playback_sink = route.sink.kind in {"speakers", "virtual_output", "file"}
+    has_capture_source = route.source.kind in _CAPTURE_SOURCE_KINDS
+    has_playback_sink = route.sink.kind in _PLAYBACK_SINK_KINDS
     if has_capture_source and has_playback_sink:
         return "hybrid"
     if has_capture_source:
@@ -1,9 +1,11 @@
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from threading import RLock
+from threading import Lock
+import time
+from typing import Iterator
 
 from ..config import get_audio_module_enabled
-from .graph import infer_route_direction
 from .schemas import (
     DUPLEX_POLICY_MODES,
     STREAM_STATES,
@@ -11,6 +13,8 @@ from .schemas import (
     AudioRouteRecord,
     AudioStreamControlRecord,
     AudioStreamRecord,
+    copy_model,
+    dump_model,
 )
 
 
@@ -22,8 +26,24 @@ class AudioPolicyViolationError(ValueError):
     pass
 
 
+# (epoch milliseconds, ISO string) of the last timestamp formatted. Bursts of
+# meter/state updates within the same millisecond reuse the string.
+_last_utc: tuple[int, str] = (-1, "")
+
+
+def _utc_from_timestamp(timestamp: float) -> str:
+    global _last_utc
+    millis = int(timestamp * 1000)
+    cached = _last_utc
+    if cached[0] == millis:
+        return cached[1]
+    text = datetime.fromtimestamp(millis / 1000, timezone.utc).isoformat(timespec="milliseconds")
+    _last_utc = (millis, text)
+    return text
+
+
 def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    return _utc_from_timestamp(time.time())
 
 
 @dataclass
@@ -39,24 +59,129 @@ class AudioModuleState:
     push_to_talk: bool = False
 
 
+@dataclass
+class AudioStreamTransition:
+    stream: AudioStreamRecord
+    interrupted: list[str]
+    previous_state: str
+
+
+_RECORD_KINDS = ("routes", "streams", "controls", "meters")
+_CAPTURE_DIRECTIONS = frozenset({"capture", "hybrid"})
+_PLAYBACK_DIRECTIONS = frozenset({"playback", "hybrid"})
+
+
 class AudioStateStore:
     def __init__(self, audio_enabled: bool):
-        self._lock = RLock()
+        self._lock = Lock()
         self._state = AudioModuleState(audio_enabled=audio_enabled)
+        # kind -> record id -> serialized dict; entries are dropped on mutation
+        # and rebuilt lazily on the next read.
+        self._serialized: dict[str, dict[str, dict]] = {kind: {} for kind in _RECORD_KINDS}
+        # Per-kind version tag, bumped on every mutation of that kind, and the
+        # assembled record list memoized against it.
+        self._versions: dict[str, int] = {kind: 0 for kind in _RECORD_KINDS}
+        self._record_lists: dict[str, tuple[int, list[dict]]] = {}
+        self._stream_locks: dict[str, Lock] = {}
+        # stream id -> (peak, rms, clipped, epoch seconds) published by audio
+        # callbacks; folded into AudioMeterSnapshot records on the next read.
+        self._meter_levels: dict[str, tuple[float, float, bool, float]] = {}
+        # Published read-only view handed out by snapshot()/list_*(). Writers
+        # drop it; the next reader rebuilds it from per-kind record copies
+        # memoized against the kind's version.
+        self._snapshot_ref: AudioModuleState | None = None
+        self._record_copies: dict[str, tuple[int, dict]] = {}
+
+    def serialized_records(self, kind: str) -> list[dict]:
+        """
+        Serialized records of one kind ("routes", "streams", "controls", "meters").
+        The dicts are shared with the cache and must not be mutated.
+        """
+        with self._lock:
+            return self._serialized_records_unlocked(kind)
+
+    def serialized_state(self) -> dict:
+        with self._lock:
+            return {
+                "audio_enabled": self._state.audio_enabled,
+                "defaults": {
+                    "default_input_device_id": self._state.default_input_device_id,
+                    "default_output_device_id": self._state.default_output_device_id,
+                },
+                "duplex_policy": self._state.duplex_policy,
+                "push_to_talk": self._state.push_to_talk,
+                **{kind: self._serialized_records_unlocked(kind) for kind in _RECORD_KINDS},
+            }
+
+    def _serialized_records_unlocked(self, kind: str) -> list[dict]:
+        if kind == "meters":
+            self._flush_meter_levels_unlocked()
+        version = self._versions[kind]
+        memo = self._record_lists.get(kind)
+        if memo is not None and memo[0] == version:
+            return memo[1]
+
+        records = getattr(self._state, kind)
+        cache = self._serialized[kind]
+        out: list[dict] = []
+        for record_id, record in records.items():
+            payload = cache.get(record_id)
+            if payload is None:
+                payload = dump_model(record)
+                cache[record_id] = payload
+            out.append(payload)
+        self._record_lists[kind] = (version, out)
+        return out
+
+    def _touch_unlocked(self, kind: str, record_id: str) -> None:
+        self._serialized[kind].pop(record_id, None)
+        self._versions[kind] += 1
+        self._snapshot_ref = None
+
+    def _touch_all_unlocked(self, kind: str) -> None:
+        self._serialized[kind].clear()
+        self._versions[kind] += 1
+        self._snapshot_ref = None
 
     def snapshot(self) -> AudioModuleState:
+        """
+        Point-in-time view of the module state. The returned object and its
+        records are shared between readers and must not be mutated.
+        """
+        # Lock-free while the published view is current; a single attribute
+        # load is atomic, and writers replace the view rather than edit it.
+        snap = self._snapshot_ref
+        if snap is not None and not self._meter_levels:
+            return snap
         with self._lock:
-            return AudioModuleState(
+            return self._snapshot_unlocked()
+
+    def _snapshot_unlocked(self) -> AudioModuleState:
+        self._flush_meter_levels_unlocked()
+        snap = self._snapshot_ref
+        if snap is None:
+            snap = AudioModuleState(
                 audio_enabled=self._state.audio_enabled,
                 default_input_device_id=self._state.default_input_device_id,
                 default_output_device_id=self._state.default_output_device_id,
-                routes={k: v.copy(deep=True) for k, v in self._state.routes.items()},
-                streams={k: v.copy(deep=True) for k, v in self._state.streams.items()},
-                controls={k: v.copy(deep=True) for k, v in self._state.controls.items()},
-                meters={k: v.copy(deep=True) for k, v in self._state.meters.items()},
+                routes=self._record_copies_unlocked("routes"),
+                streams=self._record_copies_unlocked("streams"),
+                controls=self._record_copies_unlocked("controls"),
+                meters=self._record_copies_unlocked("meters"),
                 duplex_policy=self._state.duplex_policy,
                 push_to_talk=self._state.push_to_talk,
             )
+            self._snapshot_ref = snap
+        return snap
+
+    def _record_copies_unlocked(self, kind: str) -> dict:
+        version = self._versions[kind]
+        memo = self._record_copies.get(kind)
+        if memo is not None and memo[0] == version:
+            return memo[1]
+        copies = {k: copy_model(v) for k, v in getattr(self._state, kind).items()}
+        self._record_copies[kind] = (version, copies)
+        return copies
 
     def set_defaults(
         self,
@@ -71,12 +196,15 @@ class AudioStateStore:
                 self._state.default_input_device_id = default_input_device_id
             if update_output:
                 self._state.default_output_device_id = default_output_device_id
-            return self.snapshot()
+            self._snapshot_ref = None
+            return self._snapshot_unlocked()
 
     def set_audio_enabled(self, enabled: bool) -> AudioModuleState:
         with self._lock:
             self._state.audio_enabled = bool(enabled)
+            self._snapshot_ref = None
             if not enabled:
+                self._flush_meter_levels_unlocked()
                 now = _utc_now()
                 self._state.push_to_talk = False
                 for stream in self._state.streams.values():
@@ -87,25 +215,27 @@ class AudioStateStore:
                     meter.rms = 0.0
                     meter.clipped = False
                     meter.updated_at_utc = now
-            return self.snapshot()
+                self._touch_all_unlocked("streams")
+                self._touch_all_unlocked("meters")
+            return self._snapshot_unlocked()
 
     def list_routes(self) -> list[AudioRouteRecord]:
-        with self._lock:
-            return [route.copy(deep=True) for route in self._state.routes.values()]
+        return list(self.snapshot().routes.values())
 
     def get_route(self, route_id: str) -> AudioRouteRecord:
         with self._lock:
             route = self._state.routes.get(route_id)
             if route is None:
                 raise AudioStateNotFoundError(f"Route not found: {route_id}")
-            return route.copy(deep=True)
+            return copy_model(route)
 
     def upsert_route(self, route: AudioRouteRecord) -> AudioRouteRecord:
         with self._lock:
-            saved = route.copy(deep=True)
+            saved = copy_model(route)
             self._state.routes[saved.route_id] = saved
+            self._touch_unlocked("routes", saved.route_id)
             self._ensure_stream_for_route_unlocked(saved)
-            return saved.copy(deep=True)
+            return copy_model(saved)
 
     def delete_route(self, route_id: str) -> bool:
         with self._lock:
@@ -113,6 +243,10 @@ class AudioStateStore:
             self._state.streams.pop(route_id, None)
             self._state.controls.pop(route_id, None)
             self._state.meters.pop(route_id, None)
+            self._meter_levels.pop(route_id, None)
+            self._stream_locks.pop(route_id, None)
+            for kind in _RECORD_KINDS:
+                self._touch_unlocked(kind, route_id)
             return deleted
 
     def set_duplex_policy(self, mode: str) -> AudioModuleState:
@@ -121,7 +255,8 @@ class AudioStateStore:
                 allowed = ", ".join(sorted(DUPLEX_POLICY_MODES))
                 raise ValueError(f"Invalid duplex policy '{mode}'. Allowed: {allowed}")
             self._state.duplex_policy = mode
-            return self.snapshot()
+            self._snapshot_ref = None
+            return self._snapshot_unlocked()
 
     def get_stream(self, stream_id: str) -> AudioStreamRecord:
         with self._lock:
@@ -131,38 +266,85 @@ class AudioStateStore:
                 if route is None:
                     raise AudioStateNotFoundError(f"Stream not found: {stream_id}")
                 stream = self._ensure_stream_for_route_unlocked(route)
-            return stream.copy(deep=True)
+            return copy_model(stream)
 
     def set_stream_state(self, stream_id: str, target_state: str) -> tuple[AudioStreamRecord, list[str]]:
         with self._lock:
-            if target_state not in STREAM_STATES:
-                allowed = ", ".join(sorted(STREAM_STATES))
-                raise ValueError(f"Invalid stream state '{target_state}'. Allowed: {allowed}")
-
-            stream = self._state.streams.get(stream_id)
-            if stream is None:
-                route = self._state.routes.get(stream_id)
-                if route is None:
-                    raise AudioStateNotFoundError(f"Stream not found: {stream_id}")
-                stream = self._ensure_stream_for_route_unlocked(route)
+            return self._set_stream_state_unlocked(stream_id, target_state)
 
-            interrupted: list[str] = []
-            if target_state == "running":
-                interrupted = self._apply_duplex_policy_before_start_unlocked(stream)
+    def _set_stream_state_unlocked(self, stream_id: str, target_state: str) -> tuple[AudioStreamRecord, list[str]]:
+        if target_state not in STREAM_STATES:
+            allowed = ", ".join(sorted(STREAM_STATES))
+            raise ValueError(f"Invalid stream state '{target_state}'. Allowed: {allowed}")
 
-            stream.state = target_state
-            now = _utc_now()
-            stream.last_transition_utc = now
-            meter = self._state.meters.get(stream_id)
-            if meter is None:
-                meter = AudioMeterSnapshot(stream_id=stream_id)
-                self._state.meters[stream_id] = meter
-            if target_state != "running":
-                meter.peak = 0.0
-                meter.rms = 0.0
-                meter.clipped = False
-            meter.updated_at_utc = now
-            return stream.copy(deep=True), interrupted
+        stream = self._state.streams.get(stream_id)
+        if stream is None:
+            route = self._state.routes.get(stream_id)
+            if route is None:
+                raise AudioStateNotFoundError(f"Stream not found: {stream_id}")
+            stream = self._ensure_stream_for_route_unlocked(route)
+
+        interrupted: list[str] = []
+        if target_state == "running":
+            interrupted = self._apply_duplex_policy_before_start_unlocked(stream)
+
+        self._flush_meter_levels_unlocked(stream_id)
+        stream.state = target_state
+        now = _utc_now()
+        stream.last_transition_utc = now
+        meter = self._state.meters.get(stream_id)
+        if meter is None:
+            meter = AudioMeterSnapshot(stream_id=stream_id)
+            self._state.meters[stream_id] = meter
+        if target_state != "running":
+            meter.peak = 0.0
+            meter.rms = 0.0
+            meter.clipped = False
+        meter.updated_at_utc = now
+        self._touch_unlocked("streams", stream_id)
+        self._touch_unlocked("meters", stream_id)
+        return copy_model(stream), interrupted
+
+    @contextmanager
+    def transition(self, stream_id: str, target_state: str) -> Iterator[AudioStreamTransition]:
+        """
+        Move a stream to `target_state` for the duration of the block, serialized
+        per stream. If the block raises, the stream returns to its previous state
+        and any streams it interrupted resume; the exception propagates.
+        """
+        with self._stream_lock(stream_id):
+            with self._lock:
+                stream = self._state.streams.get(stream_id)
+                if stream is None:
+                    route = self._state.routes.get(stream_id)
+                    if route is None:
+                        # Unknown ids (e.g. from request paths) must not leave a lock behind.
+                        self._stream_locks.pop(stream_id, None)
+                        raise AudioStateNotFoundError(f"Stream not found: {stream_id}")
+                    stream = self._ensure_stream_for_route_unlocked(route)
+                previous_state = stream.state
+                record, interrupted = self._set_stream_state_unlocked(stream_id, target_state)
+
+            change = AudioStreamTransition(
+                stream=record,
+                interrupted=interrupted,
+                previous_state=previous_state,
+            )
+            try:
+                yield change
+            except BaseException:
+                self.set_stream_state_force(stream_id, previous_state)
+                for interrupted_id in interrupted:
+                    self.set_stream_state_force(interrupted_id, "running")
+                raise
+
+    def _stream_lock(self, stream_id: str) -> Lock:
+        with self._lock:
+            lock = self._stream_locks.get(stream_id)
+            if lock is None:
+                lock = Lock()
+                self._stream_locks[stream_id] = lock
+            return lock
 
     def set_stream_state_force(self, stream_id: str, target_state: str) -> AudioStreamRecord:
         with self._lock:
@@ -177,6 +359,7 @@ class AudioStateStore:
                     raise AudioStateNotFoundError(f"Stream not found: {stream_id}")
                 stream = self._ensure_stream_for_route_unlocked(route)
 
+            self._flush_meter_levels_unlocked(stream_id)
             stream.state = target_state
             now = _utc_now()
             stream.last_transition_utc = now
@@ -189,7 +372,9 @@ class AudioStateStore:
                 meter.rms = 0.0
                 meter.clipped = False
             meter.updated_at_utc = now
-            return stream.copy(deep=True)
+            self._touch_unlocked("streams", stream_id)
+            self._touch_unlocked("meters", stream_id)
+            return copy_model(stream)
 
     def set_controls(
         self,
@@ -218,31 +403,73 @@ class AudioStateStore:
                 control.gain_db = float(gain_db or 0.0)
             if update_muted:
                 control.muted = bool(muted)
+            self._touch_unlocked("controls", stream_id)
             if update_push_to_talk:
                 self._state.push_to_talk = bool(push_to_talk)
+                self._snapshot_ref = None
 
-            return control.copy(deep=True), self._state.push_to_talk
+            return copy_model(control), self._state.push_to_talk
 
     def set_push_to_talk(self, enabled: bool) -> bool:
         with self._lock:
             self._state.push_to_talk = bool(enabled)
+            self._snapshot_ref = None
             return self._state.push_to_talk
 
+    def control_version(self) -> int:
+        """
+        Version tag of the controls, bumped by every control mutation. Audio
+        callbacks compare it to skip get_control() while nothing has changed.
+        """
+        # A single int read; no lock needed.
+        return self._versions["controls"]
+
     def get_control(self, stream_id: str) -> AudioStreamControlRecord:
         with self._lock:
             control = self._state.controls.get(stream_id)
             if control is None:
                 return AudioStreamControlRecord(stream_id=stream_id)
-            return control.copy(deep=True)
+            return copy_model(control)
 
     def upsert_meter(self, meter: AudioMeterSnapshot) -> AudioMeterSnapshot:
         with self._lock:
-            self._state.meters[meter.stream_id] = meter.copy(deep=True)
-            return meter.copy(deep=True)
+            self._meter_levels.pop(meter.stream_id, None)
+            self._state.meters[meter.stream_id] = copy_model(meter)
+            self._touch_unlocked("meters", meter.stream_id)
+            return copy_model(meter)
+
+    def publish_meter_levels(self, stream_id: str, peak: float, rms: float, clipped: bool) -> None:
+        """
+        Hot-path meter update for audio callbacks: records the raw levels and a
+        timestamp only. The snapshot model and its ISO time string are built
+        when meters are read.
+        """
+        with self._lock:
+            self._meter_levels[stream_id] = (peak, rms, clipped, time.time())
+
+    def _flush_meter_levels_unlocked(self, stream_id: str | None = None) -> None:
+        if not self._meter_levels:
+            return
+        if stream_id is None:
+            pending = self._meter_levels
+            self._meter_levels = {}
+        else:
+            levels = self._meter_levels.pop(stream_id, None)
+            if levels is None:
+                return
+            pending = {stream_id: levels}
+        for meter_id, (peak, rms, clipped, published_at) in pending.items():
+            self._state.meters[meter_id] = AudioMeterSnapshot(
+                stream_id=meter_id,
+                peak=peak,
+                rms=rms,
+                clipped=clipped,
+                updated_at_utc=_utc_from_timestamp(published_at),
+            )
+            self._touch_unlocked("meters", meter_id)
 
     def list_meters(self) -> list[AudioMeterSnapshot]:
-        with self._lock:
-            return [meter.copy(deep=True) for meter in self._state.meters.values()]
+        return list(self.snapshot().meters.values())
 
     def any_running_streams(self) -> bool:
         with self._lock:
@@ -253,7 +480,7 @@ class AudioStateStore:
 
     def _ensure_stream_for_route_unlocked(self, route: AudioRouteRecord) -> AudioStreamRecord:
         stream = self._state.streams.get(route.route_id)
-        direction = infer_route_direction(route)
+        direction = route.direction
         if stream is None:
             stream = AudioStreamRecord(
                 stream_id=route.route_id,
@@ -264,23 +491,26 @@ class AudioStateStore:
         else:
             stream.direction = direction
             stream.route_id = route.route_id
+        self._touch_unlocked("streams", route.route_id)
 
         if route.route_id not in self._state.controls:
             self._state.controls[route.route_id] = AudioStreamControlRecord(stream_id=route.route_id)
+            self._touch_unlocked("controls", route.route_id)
         if route.route_id not in self._state.meters:
             self._state.meters[route.route_id] = AudioMeterSnapshot(
                 stream_id=route.route_id,
                 updated_at_utc=_utc_now(),
             )
+            self._touch_unlocked("meters", route.route_id)
         return stream
 
     @staticmethod
     def _is_capture_direction(direction: str) -> bool:
-        return direction in {"capture", "hybrid"}
+        return direction in _CAPTURE_DIRECTIONS
 
     @staticmethod
     def _is_playback_direction(direction: str) -> bool:
-        return direction in {"playback", "hybrid"}
+        return direction in _PLAYBACK_DIRECTIONS
 
     def _apply_duplex_policy_before_start_unlocked(self, stream: AudioStreamRecord) -> list[str]:
         mode = self._state.duplex_policy
@@ -307,6 +537,7 @@ class AudioStateStore:
             for active in running_playback:
                 active.state = "paused"
                 active.last_transition_utc = _utc_now()
+                self._touch_unlocked("streams", active.stream_id)
                 interrupted.append(active.stream_id)
             return interrupted
 
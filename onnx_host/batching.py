@@ -0,0 +1,139 @@
+import asyncio
+
+import numpy as np
+
+from .runtime import BoundSession, run_in_ort_executor
+
+
+def has_dynamic_batch_dim(session) -> bool:
+    """True when every session input has a symbolic/unknown leading dimension."""
+    inputs = session.get_inputs()
+    if not inputs:
+        return False
+    for inp in inputs:
+        shape = inp.shape or []
+        if not shape:
+            return False
+        lead = shape[0]
+        if isinstance(lead, int) and lead > 0:
+            return False
+    return True
+
+
+def _batch_signature(feeds: dict[str, np.ndarray]):
+    """Key under which feeds can be concatenated, or None if they must run alone."""
+    sizes = {value.shape[0] if value.ndim else None for value in feeds.values()}
+    if len(sizes) != 1 or None in sizes:
+        return None
+    return tuple(sorted((name, value.shape[1:], value.dtype.str) for name, value in feeds.items()))
+
+
+class PredictBatcher:
+    """
+    Coalesces concurrent single-item predict calls into one batched run.
+
+    Requests queued within `max_wait_ms` of the first one (up to `max_batch_size`)
+    are concatenated along axis 0, run once, and split back per caller.
+    """
+
+    def __init__(self, bound: BoundSession, *, max_batch_size: int, max_wait_ms: float):
+        self.bound = bound
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self._queue: asyncio.Queue[tuple[dict[str, np.ndarray], asyncio.Future]] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Requests taken off the queue but not answered yet: the batch being
+        # collected or run. Shutdown fails these along with the queued ones.
+        self._in_flight: list[tuple[dict[str, np.ndarray], asyncio.Future]] = []
+
+    def start(self) -> None:
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._task = self._loop.create_task(self._run())
+
+    def close(self) -> None:
+        """Stop the batching task; safe to call from sync (threadpool) routes."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._shutdown)
+
+    def _shutdown(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._fail_in_flight()
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Model unloaded"))
+
+    def _fail_in_flight(self) -> None:
+        in_flight, self._in_flight = self._in_flight, []
+        for _, future in in_flight:
+            if not future.done():
+                future.set_exception(RuntimeError("Model unloaded"))
+
+    async def submit(self, input_data: dict) -> list:
+        feeds = self.bound.to_feeds(input_data)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((feeds, future))
+        return await future
+
+    async def _collect(self) -> list[tuple[dict[str, np.ndarray], asyncio.Future]]:
+        batch = self._in_flight = [await self._queue.get()]
+        if self.max_batch_size > 1 and self.max_wait > 0 and self._queue.qsize() < self.max_batch_size - 1:
+            await asyncio.sleep(self.max_wait)
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                await self._run_batch(await self._collect())
+                self._in_flight = []
+        except asyncio.CancelledError:
+            # Cancelled mid-batch (close/unload): the ORT call is abandoned, so
+            # answer its callers here instead of leaving them waiting.
+            self._fail_in_flight()
+            raise
+
+    async def _run_batch(self, batch: list[tuple[dict[str, np.ndarray], asyncio.Future]]) -> None:
+        groups: dict[object, list[tuple[dict[str, np.ndarray], asyncio.Future]]] = {}
+        for index, item in enumerate(batch):
+            key = _batch_signature(item[0])
+            groups.setdefault(key if key is not None else ("single", index), []).append(item)
+
+        for group in groups.values():
+            try:
+                results = await run_in_ort_executor(self._run_group, [feeds for feeds, _ in group])
+            except Exception as exc:
+                for _, future in group:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(group, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def _run_group(self, items: list[dict[str, np.ndarray]]) -> list[list]:
+        if len(items) == 1:
+            return [self.bound.run(items[0])]
+
+        names = list(items[0])
+        feeds = {name: np.concatenate([item[name] for item in items], axis=0) for name in names}
+        sizes = [item[names[0]].shape[0] for item in items]
+        total = sum(sizes)
+        offsets = np.cumsum(sizes)[:-1]
+
+        outputs = self.bound.run(feeds)
+        per_item: list[list] = [[] for _ in items]
+        for out in outputs:
+            arr = np.asarray(out)
+            if arr.ndim >= 1 and arr.shape[0] == total:
+                parts = np.split(arr, offsets)
+            else:
+                parts = [arr] * len(items)
+            for bucket, part in zip(per_item, parts):
+                bucket.append(part)
+        return per_item
@@ -5,6 +5,9 @@ import os
 MODELS_DIR = Path("ONNX host service") / "models"
 REGISTRY_PATH = MODELS_DIR / "models.json"
 
+# Windows needs the extended-length prefix for paths at or past MAX_PATH.
+_LONG_PATH_PREFIX = "\\\\?\\" if os.name == "nt" else None
+
 
 def get_env_bool(name: str, default: bool = False) -> bool:
     raw = os.getenv(name)
@@ -13,6 +16,38 @@ def get_env_bool(name: str, default: bool = False) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def get_env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw.strip())
+    except ValueError:
+        return default
+
+
+def get_env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw.strip())
+    except ValueError:
+        return default
+
+
+# Micro-batching window for /predict on models with a dynamic batch dimension.
+# PREDICT_MAX_BATCH_SIZE=1 disables coalescing.
+PREDICT_MAX_BATCH_SIZE = get_env_int("PREDICT_MAX_BATCH_SIZE", 8)
+PREDICT_MAX_WAIT_MS = get_env_float("PREDICT_MAX_WAIT_MS", 5.0)
+
+# Worker threads that run ONNX Runtime calls off the event loop.
+ORT_EXECUTOR_WORKERS = max(1, get_env_int("ORT_EXECUTOR_WORKERS", 2))
+
+# Threads walking model folders in parallel during registry scans; 1 walks
+# them sequentially.
+REGISTRY_SCAN_WORKERS = max(1, get_env_int("REGISTRY_SCAN_WORKERS", 8))
+
 _AUDIO_MODULE_ENABLED = get_env_bool("ENABLE_AUDIO_MODULE", default=False)
 
 # Backward-compatible read-only snapshot at import time.
@@ -29,13 +64,20 @@ def set_audio_module_enabled(enabled: bool) -> bool:
     return _AUDIO_MODULE_ENABLED
 
 
+def path_mtime_ns(path: Path) -> int | None:
+    """Return the path's mtime in nanoseconds, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def normalize_model_path(path: Path) -> str:
     """
     Normalize a model path for use with ONNX Runtime, including
     long-path handling on Windows.
     """
-    resolved = path.resolve()
-    model_path = str(resolved)
-    if os.name == "nt" and len(model_path) >= 260:
-        return "\\\\?\\" + model_path
+    model_path = str(path.resolve())
+    if _LONG_PATH_PREFIX is not None and len(model_path) >= 260:
+        return _LONG_PATH_PREFIX + model_path
     return model_path
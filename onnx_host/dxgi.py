@@ -1,5 +1,8 @@
+import atexit
 import ctypes
 from ctypes import wintypes
+from functools import lru_cache
+from threading import Lock
 
 
 DXGI_MEMORY_SEGMENT_GROUP_LOCAL = 0
@@ -60,9 +63,14 @@ class DXGI_QUERY_VIDEO_MEMORY_INFO(ctypes.Structure):
     ]
 
 
+@lru_cache(maxsize=None)
+def _prototype(restype, argtypes: tuple):
+    return ctypes.CFUNCTYPE(restype, *argtypes)
+
+
 def _vtbl_fn(ptr, index, restype, argtypes):
     vtbl = ctypes.cast(ptr, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
-    fn = ctypes.CFUNCTYPE(restype, *argtypes)(vtbl[index])
+    fn = _prototype(restype, tuple(argtypes))(vtbl[index])
     return fn
 
 
@@ -72,102 +80,140 @@ def _release(ptr):
     _vtbl_fn(ptr, 2, wintypes.ULONG, [ctypes.c_void_p])(ptr)
 
 
-def _get_dxgi_vram_status() -> dict:
-    dxgi = ctypes.WinDLL("dxgi")
-    create_factory = dxgi.CreateDXGIFactory1
-    create_factory.argtypes = [ctypes.POINTER(GUID), ctypes.POINTER(ctypes.c_void_p)]
-    create_factory.restype = HRESULT
-
-    factory = ctypes.c_void_p()
-    hr = create_factory(ctypes.byref(IID_IDXGIFactory1), ctypes.byref(factory))
-    if hr != 0 or not factory:
-        raise RuntimeError("DXGI factory creation failed")
+class _Adapter3:
+    """
+    IDXGIAdapter3 for the first adapter, with its description and bound
+    QueryVideoMemoryInfo, kept open between VRAM polls.
+    """
 
-    adapter = ctypes.c_void_p()
-    try:
-        enum_adapters1 = _vtbl_fn(
-            factory,
-            12,
-            HRESULT,
-            [ctypes.c_void_p, wintypes.UINT, ctypes.POINTER(ctypes.c_void_p)],
-        )
-        hr = enum_adapters1(factory, 0, ctypes.byref(adapter))
-        if hr != 0 or not adapter:
-            raise RuntimeError("No DXGI adapter found")
-
-        desc = DXGI_ADAPTER_DESC1()
-        get_desc1 = _vtbl_fn(
-            adapter,
-            10,
-            HRESULT,
-            [ctypes.c_void_p, ctypes.POINTER(DXGI_ADAPTER_DESC1)],
-        )
-        hr = get_desc1(adapter, ctypes.byref(desc))
-        if hr != 0:
-            raise RuntimeError("DXGI GetDesc1 failed")
+    def __init__(self):
+        dxgi = ctypes.WinDLL("dxgi")
+        create_factory = dxgi.CreateDXGIFactory1
+        create_factory.argtypes = [ctypes.POINTER(GUID), ctypes.POINTER(ctypes.c_void_p)]
+        create_factory.restype = HRESULT
 
-        adapter3 = ctypes.c_void_p()
-        query_interface = _vtbl_fn(
-            adapter,
-            0,
-            HRESULT,
-            [ctypes.c_void_p, ctypes.POINTER(GUID), ctypes.POINTER(ctypes.c_void_p)],
-        )
-        hr = query_interface(adapter, ctypes.byref(IID_IDXGIAdapter3), ctypes.byref(adapter3))
-        if hr != 0 or not adapter3:
-            raise RuntimeError("IDXGIAdapter3 not available")
+        factory = ctypes.c_void_p()
+        hr = create_factory(ctypes.byref(IID_IDXGIFactory1), ctypes.byref(factory))
+        if hr != 0 or not factory:
+            raise RuntimeError("DXGI factory creation failed")
 
+        adapter = ctypes.c_void_p()
         try:
-            info = DXGI_QUERY_VIDEO_MEMORY_INFO()
-            query_video_memory = _vtbl_fn(
-                adapter3,
-                14,
+            enum_adapters1 = _vtbl_fn(
+                factory,
+                12,
                 HRESULT,
-                [
-                    ctypes.c_void_p,
-                    wintypes.UINT,
-                    wintypes.UINT,
-                    ctypes.POINTER(DXGI_QUERY_VIDEO_MEMORY_INFO),
-                ],
+                [ctypes.c_void_p, wintypes.UINT, ctypes.POINTER(ctypes.c_void_p)],
             )
-            hr = query_video_memory(
-                adapter3,
-                0,
-                DXGI_MEMORY_SEGMENT_GROUP_LOCAL,
-                ctypes.byref(info),
+            hr = enum_adapters1(factory, 0, ctypes.byref(adapter))
+            if hr != 0 or not adapter:
+                raise RuntimeError("No DXGI adapter found")
+
+            desc = DXGI_ADAPTER_DESC1()
+            get_desc1 = _vtbl_fn(
+                adapter,
+                10,
+                HRESULT,
+                [ctypes.c_void_p, ctypes.POINTER(DXGI_ADAPTER_DESC1)],
             )
+            hr = get_desc1(adapter, ctypes.byref(desc))
             if hr != 0:
-                # NON_LOCAL fallback
-                hr = query_video_memory(adapter3, 0, 1, ctypes.byref(info))
-            if hr != 0:
-                total_mb = int(desc.DedicatedVideoMemory / (1024 * 1024))
-                return {
-                    "vendor": desc.Description.strip(),
-                    "vram_used_mb": 0,
-                    "vram_total_mb": total_mb,
-                    "vram_free_mb": total_mb,
-                    "warning": "DXGI QueryVideoMemoryInfo failed; using adapter dedicated memory.",
-                }
-
-            used_mb = int(info.CurrentUsage / (1024 * 1024))
-            total_mb = (
-                int(info.Budget / (1024 * 1024))
-                if info.Budget
-                else int(desc.DedicatedVideoMemory / (1024 * 1024))
+                raise RuntimeError("DXGI GetDesc1 failed")
+
+            adapter3 = ctypes.c_void_p()
+            query_interface = _vtbl_fn(
+                adapter,
+                0,
+                HRESULT,
+                [ctypes.c_void_p, ctypes.POINTER(GUID), ctypes.POINTER(ctypes.c_void_p)],
             )
-            free_mb = max(total_mb - used_mb, 0)
+            hr = query_interface(adapter, ctypes.byref(IID_IDXGIAdapter3), ctypes.byref(adapter3))
+            if hr != 0 or not adapter3:
+                raise RuntimeError("IDXGIAdapter3 not available")
+        finally:
+            # adapter3 holds its own reference; the factory and base adapter
+            # are not needed past this point.
+            _release(adapter)
+            _release(factory)
+
+        self.ptr = adapter3
+        self.vendor = desc.Description.strip()
+        self.dedicated_mb = int(desc.DedicatedVideoMemory / (1024 * 1024))
+        self.query_video_memory = _vtbl_fn(
+            adapter3,
+            14,
+            HRESULT,
+            [
+                ctypes.c_void_p,
+                wintypes.UINT,
+                wintypes.UINT,
+                ctypes.POINTER(DXGI_QUERY_VIDEO_MEMORY_INFO),
+            ],
+        )
+        self.info = DXGI_QUERY_VIDEO_MEMORY_INFO()
+
+    def release(self) -> None:
+        ptr, self.ptr = self.ptr, None
+        _release(ptr)
+
+
+_adapter_lock = Lock()
+_adapter: _Adapter3 | None = None
+
+
+def _release_adapter() -> None:
+    global _adapter
+    with _adapter_lock:
+        adapter, _adapter = _adapter, None
+    if adapter is not None:
+        adapter.release()
+
 
+atexit.register(_release_adapter)
+
+
+def _get_dxgi_vram_status() -> dict:
+    global _adapter
+    with _adapter_lock:
+        adapter = _adapter
+        if adapter is None:
+            adapter = _Adapter3()
+            _adapter = adapter
+
+        info = adapter.info
+        hr = adapter.query_video_memory(
+            adapter.ptr,
+            0,
+            DXGI_MEMORY_SEGMENT_GROUP_LOCAL,
+            ctypes.byref(info),
+        )
+        if hr != 0:
+            # NON_LOCAL fallback
+            hr = adapter.query_video_memory(adapter.ptr, 0, 1, ctypes.byref(info))
+        if hr != 0:
+            # Drop the cached adapter so the next poll re-enumerates, e.g.
+            # after a driver reset.
+            _adapter = None
+            adapter.release()
+            total_mb = adapter.dedicated_mb
             return {
-                "vendor": desc.Description.strip(),
-                "vram_used_mb": used_mb,
+                "vendor": adapter.vendor,
+                "vram_used_mb": 0,
                 "vram_total_mb": total_mb,
-                "vram_free_mb": free_mb,
+                "vram_free_mb": total_mb,
+                "warning": "DXGI QueryVideoMemoryInfo failed; using adapter dedicated memory.",
             }
-        finally:
-            _release(adapter3)
-    finally:
-        _release(adapter)
-        _release(factory)
+
+        used_mb = int(info.CurrentUsage / (1024 * 1024))
+        total_mb = int(info.Budget / (1024 * 1024)) if info.Budget else adapter.dedicated_mb
+        free_mb = max(total_mb - used_mb, 0)
+
+        return {
+            "vendor": adapter.vendor,
+            "vram_used_mb": used_mb,
+            "vram_total_mb": total_mb,
+            "vram_free_mb": free_mb,
+        }
 
 
 def get_vram_status() -> dict:
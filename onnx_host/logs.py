@@ -1,19 +1,48 @@
 from __future__ import annotations
 
+import itertools
 import logging
-from collections import deque
 from datetime import datetime, timezone
-from threading import Lock
+from functools import lru_cache
 from traceback import format_exception
 
 
 _MAX_ENTRIES = 5000
-_BUFFER: deque[dict] = deque(maxlen=_MAX_ENTRIES)
-_LOCK = Lock()
+# Lock-free ring: each emit claims a sequence number from the counter (next()
+# on itertools.count is atomic under the GIL) and stores (seq, entry) in slot
+# seq % _MAX_ENTRIES. Readers walk back from the head and skip slots whose
+# sequence does not match, i.e. ones not yet written or already lapped.
+# _HEAD is only a hint: concurrent emits can publish it out of order, so
+# readers move it forward past slots that are already written (_current_head).
+_SLOTS: list[tuple[int, dict] | None] = [None] * _MAX_ENTRIES
+_SEQUENCE = itertools.count()
+_HEAD = 0
 _HANDLER: "InMemoryLogHandler | None" = None
 _LOGGER_NAMES = ("onnx_host", "uvicorn.error", "uvicorn.access")
-
-
+_LEVEL_NUMBERS = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+# What /logs exposes; "created" and "levelno" stay internal to the buffer.
+_PUBLIC_FIELDS = ("timestamp", "level", "logger", "subsystem", "message")
+
+
+def _level_number(level_name) -> int | None:
+    normalized = str(level_name).upper()
+    level = _LEVEL_NUMBERS.get(normalized)
+    if level is None:
+        # Custom levels registered through logging.addLevelName().
+        level = logging.getLevelName(normalized)
+        if not isinstance(level, int):
+            return None
+    return level
+
+
+@lru_cache(maxsize=256)
 def _subsystem_from_logger(logger_name: str) -> str:
     if not logger_name:
         return "root"
@@ -40,8 +69,11 @@ class InMemoryLogHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
         logger_name = record.name
         entry = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            # Formatted when the entry is first served by get_recent_logs().
+            "timestamp": None,
+            "created": record.created,
             "level": record.levelname,
+            "levelno": record.levelno,
             "logger": logger_name,
             "subsystem": _subsystem_from_logger(logger_name),
             "message": record.getMessage(),
@@ -50,8 +82,11 @@ class InMemoryLogHandler(logging.Handler):
         if record.exc_info:
             entry["exception"] = "".join(format_exception(*record.exc_info)).rstrip()
 
-        with _LOCK:
-            _BUFFER.append(entry)
+        global _HEAD
+        seq = next(_SEQUENCE)
+        _SLOTS[seq % _MAX_ENTRIES] = (seq, entry)
+        if seq >= _HEAD:
+            _HEAD = seq + 1
 
 
 def _attach_handler(logger: logging.Logger, handler: logging.Handler) -> None:
@@ -72,8 +107,27 @@ def setup_runtime_logging() -> None:
 
 
 def clear_logs() -> None:
-    with _LOCK:
-        _BUFFER.clear()
+    _SLOTS[:] = [None] * _MAX_ENTRIES
+
+
+def _public_entry(item: dict) -> dict:
+    if item["timestamp"] is None:
+        # Cached on the buffered entry so it is formatted once.
+        item["timestamp"] = datetime.fromtimestamp(item["created"], tz=timezone.utc).isoformat()
+    entry = {field: item[field] for field in _PUBLIC_FIELDS}
+    if "exception" in item:
+        entry["exception"] = item["exception"]
+    return entry
+
+
+def _current_head() -> int:
+    head = _HEAD
+    for _ in range(_MAX_ENTRIES):
+        slot = _SLOTS[head % _MAX_ENTRIES]
+        if slot is None or slot[0] != head:
+            break
+        head += 1
+    return head
 
 
 def get_recent_logs(
@@ -83,23 +137,23 @@ def get_recent_logs(
 ) -> list[dict]:
     level_value = None
     if min_level:
-        normalized = min_level.upper()
-        level_value = logging.getLevelName(normalized)
-        if not isinstance(level_value, int):
-            level_value = None
-
-    with _LOCK:
-        items = list(_BUFFER)
-
-    if not include_access_logs:
-        items = [item for item in items if item.get("logger") != "uvicorn.access"]
-
-    if level_value is not None:
-        filtered: list[dict] = []
-        for item in items:
-            item_level = logging.getLevelName(str(item.get("level", "")).upper())
-            if isinstance(item_level, int) and item_level >= level_value:
-                filtered.append(item)
-        items = filtered
-
-    return items[-limit:]
+        level_value = _level_number(min_level)
+
+    collected: list[dict] = []
+    head = _current_head()
+    # Newest first, so the walk stops as soon as `limit` entries match.
+    for seq in range(head - 1, max(head - _MAX_ENTRIES, 0) - 1, -1):
+        slot = _SLOTS[seq % _MAX_ENTRIES]
+        if slot is None or slot[0] != seq:
+            continue
+        item = slot[1]
+        if not include_access_logs and item.get("logger") == "uvicorn.access":
+            continue
+        if level_value is not None and item["levelno"] < level_value:
+            continue
+        collected.append(_public_entry(item))
+        if len(collected) == limit:
+            break
+
+    collected.reverse()
+    return collected
@@ -1,13 +1,27 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import audio_router, engine_router, logs_router, models_router, status_router
 from .logs import setup_runtime_logging
+from .pollers import start_pollers, stop_pollers
+from .transport import NegotiatedResponse
 
 
 setup_runtime_logging()
 
-app = FastAPI(title="Minimal ONNX Host")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    start_pollers()
+    try:
+        yield
+    finally:
+        await stop_pollers()
+
+
+app = FastAPI(title="Minimal ONNX Host", default_response_class=NegotiatedResponse, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,8 +29,12 @@ app.add_middleware(
         "http://localhost:5173",
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Everything the routers and runtime-ui actually use; Content-Type and
+    # Accept carry the JSON/MessagePack negotiation.
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Accept"],
+    # Let the browser reuse a preflight for a day instead of re-sending it.
+    max_age=86400,
 )
 
 app.include_router(engine_router)
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from typing import Any, Callable
+
+from .audio import enumerate_audio_devices
+from .config import get_audio_module_enabled
+from .dxgi import get_vram_status
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SnapshotPoller:
+    """
+    Refreshes a blocking probe on a background task so endpoints can serve the
+    last snapshot instantly. Before the first poll completes, reads probe inline.
+    """
+
+    def __init__(self, name: str, probe: Callable[[], Any], interval_seconds: float):
+        self.name = name
+        self.probe = probe
+        self.interval_seconds = interval_seconds
+        self._value: Any = None
+        self._task: asyncio.Task | None = None
+
+    def get(self) -> Any:
+        value = self._value
+        if value is None:
+            value = self.probe()
+            self._value = value
+        return value
+
+    def refresh(self) -> Any:
+        """Re-run the probe inline, e.g. after a known hotplug, and keep the result."""
+        value = self.probe()
+        self._value = value
+        return value
+
+    async def get_async(self) -> Any:
+        value = self._value
+        if value is None:
+            value = await asyncio.to_thread(self.probe)
+            self._value = value
+        return value
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run(), name=f"poller-{self.name}")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                self._value = await asyncio.to_thread(self.probe)
+            except Exception:
+                LOGGER.debug("Snapshot poller %s failed", self.name, exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
+
+
+vram_status_poller = SnapshotPoller("vram", get_vram_status, interval_seconds=0.5)
+audio_devices_poller = SnapshotPoller("audio-devices", enumerate_audio_devices, interval_seconds=2.0)
+
+_POLLERS = (vram_status_poller, audio_devices_poller)
+
+
+def start_pollers() -> None:
+    vram_status_poller.start()
+    # Device enumeration hits PortAudio, so it only runs while the audio module is on.
+    if get_audio_module_enabled():
+        audio_devices_poller.start()
+
+
+async def set_audio_devices_polling(enabled: bool) -> None:
+    if enabled:
+        audio_devices_poller.start()
+    else:
+        await audio_devices_poller.stop()
+
+
+async def stop_pollers() -> None:
+    for poller in _POLLERS:
+        await poller.stop()
@@ -1,79 +1,202 @@
-import json
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+import os
+import re
+import time
+from threading import Lock
 
-from .config import MODELS_DIR, REGISTRY_PATH
+import orjson
+
+from .config import MODELS_DIR, REGISTRY_PATH, REGISTRY_SCAN_WORKERS, path_mtime_ns
 from .state import loaded_models
 
 
+# Repeated /models and load calls within this window reuse the last scan as
+# long as the registry file, the models folder and the loaded set are unchanged.
+_SCAN_CACHE_TTL_SECONDS = 5.0
+_SCAN_LOCK = Lock()
+_scan_cache: dict | None = None
+_scan_index: dict[str, dict] = {}
+_scan_cache_key: tuple | None = None
+_scan_cache_at = 0.0
+_registry_version = 0
+
+
 KNOWN_VARIANT_SUFFIXES = {
     "fp32", "fp16", "bf16", "int8", "int4", "int3", "int2",
     "q8", "q6", "q5", "q4", "q3", "q2", "uint8"
 }
+# "<name>_<suffix>" with a known suffix at the very end of the stem.
+_VARIANT_SUFFIX_RE = re.compile(
+    "_(" + "|".join(sorted(map(re.escape, KNOWN_VARIANT_SUFFIXES))) + r")\Z",
+    re.IGNORECASE,
+)
 
 
-def _variant_id_from_filename(file_path: Path) -> str:
-    stem = file_path.stem
-    if "_" in stem:
-        suffix = stem.rsplit("_", 1)[-1].lower()
-        if suffix in KNOWN_VARIANT_SUFFIXES:
-            return suffix
+def _variant_id_from_stem(stem: str) -> str:
+    match = _VARIANT_SUFFIX_RE.search(stem)
+    if match is not None:
+        return match.group(1).lower()
     return stem
 
 
-def _collect_artifacts(onnx_path: Path) -> list[str]:
-    artifacts = [onnx_path]
-    for extra in onnx_path.parent.glob(f"{onnx_path.stem}.onnx_data*"):
-        artifacts.append(extra)
-    return [str(p.relative_to(MODELS_DIR)) for p in artifacts]
+def _collect_variants(model_dir: str, model_rel: str) -> dict[str, list[str]]:
+    """
+    Walk a model folder with os.scandir and group each .onnx file, plus its
+    `<stem>.onnx_data*` siblings from the same listing, by variant id. Paths are
+    relative to MODELS_DIR. Name matching follows the platform's case rules.
+    """
+    variants_map: dict[str, list[str]] = {}
+    stack = [(model_dir, model_rel)]
+    while stack:
+        dir_path, dir_rel = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        folded = [os.path.normcase(entry.name) for entry in entries]
+        for entry, name in zip(entries, folded):
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((entry.path, os.path.join(dir_rel, entry.name)))
+                continue
+            if not name.endswith(".onnx"):
+                continue
+            stem = entry.name[: -len(".onnx")]
+            data_prefix = name + "_data"
+            artifacts = variants_map.setdefault(_variant_id_from_stem(stem), [])
+            artifacts.append(os.path.join(dir_rel, entry.name))
+            artifacts.extend(
+                os.path.join(dir_rel, sibling.name)
+                for sibling, sibling_name in zip(entries, folded)
+                if sibling_name.startswith(data_prefix)
+            )
+    return variants_map
+
+
+def invalidate_registry_cache() -> None:
+    """Force the next scan_models_registry() call to rescan disk."""
+    global _registry_version
+    with _SCAN_LOCK:
+        _registry_version += 1
+
+
+def _models_dir_fingerprint() -> tuple:
+    """
+    (name, mtime_ns) of every direct child of MODELS_DIR, registry file
+    included. Adding, removing or renaming a model folder, or a file directly
+    inside one, changes it; deeper edits are picked up once the TTL lapses.
+    """
+    children = []
+    try:
+        with os.scandir(MODELS_DIR) as it:
+            for entry in it:
+                try:
+                    children.append((entry.name, entry.stat().st_mtime_ns))
+                except OSError:
+                    children.append((entry.name, None))
+    except OSError:
+        return (path_mtime_ns(MODELS_DIR),)
+    children.sort()
+    return tuple(children)
+
+
+def _scan_cache_fingerprint() -> tuple:
+    return (_registry_version, _models_dir_fingerprint())
 
 
 def scan_models_registry() -> dict:
+    """
+    Return the model registry, rescanning disk at most every few seconds.
+    The returned dict is shared with the cache and must not be mutated.
+    """
+    global _scan_cache, _scan_index, _scan_cache_key, _scan_cache_at
+    with _SCAN_LOCK:
+        now = time.monotonic()
+        if (
+            _scan_cache is not None
+            and now - _scan_cache_at < _SCAN_CACHE_TTL_SECONDS
+            and _scan_cache_key == _scan_cache_fingerprint()
+        ):
+            return _scan_cache
+
+        registry = _scan_models_registry_uncached()
+        _scan_cache = registry
+        _scan_index = {m["id"]: m for m in registry["models"] if m.get("id")}
+        _scan_cache_key = _scan_cache_fingerprint()
+        _scan_cache_at = now
+        return registry
+
+
+def get_registry_model(model_id: str) -> dict | None:
+    """O(1) lookup of a registry entry by id, backed by the scan cache."""
+    scan_models_registry()
+    with _SCAN_LOCK:
+        return _scan_index.get(model_id)
+
+
+def _scan_model_entry(model_dir: os.DirEntry, loaded: frozenset[str]) -> dict:
+    model_id = model_dir.name
+    variants_map = _collect_variants(model_dir.path, model_id)
+
+    variants = [
+        {
+            "id": vid,
+            "artifacts": sorted(set(artifacts))
+        }
+        # Variant ids are unique keys, so the item tuples order by id alone.
+        for vid, artifacts in sorted(variants_map.items())
+    ]
+
+    model_entry: dict = {
+        "id": model_id,
+        "root": model_id,
+        "path": None,
+        "variants": variants,
+        "missing": False,
+        "loaded": model_id in loaded
+    }
+
+    for variant in variants:
+        onnx_artifacts = [a for a in variant["artifacts"] if a.endswith(".onnx")]
+        if onnx_artifacts:
+            model_entry["path"] = onnx_artifacts[0]
+            break
+
+    return model_entry
+
+
+def _scan_models_registry_uncached() -> dict:
     registry: dict = {"models": []}
+    previous = None
     if REGISTRY_PATH.exists():
         try:
-            registry = json.loads(REGISTRY_PATH.read_text())
+            previous = REGISTRY_PATH.read_bytes()
+            registry = orjson.loads(previous)
         except Exception:
             registry = {"models": []}
 
     existing_by_id = {m.get("id"): m for m in registry.get("models", []) if m.get("id")}
-    found_ids = set()
     models_out = []
 
-    if MODELS_DIR.exists():
-        for model_dir in sorted([p for p in MODELS_DIR.iterdir() if p.is_dir()], key=lambda p: p.name.lower()):
-            model_id = model_dir.name
-            found_ids.add(model_id)
-
-            onnx_files = list(model_dir.rglob("*.onnx"))
-            variants_map: dict[str, list[str]] = {}
-            for onnx_path in onnx_files:
-                variant_id = _variant_id_from_filename(onnx_path)
-                variants_map.setdefault(variant_id, []).extend(_collect_artifacts(onnx_path))
-
-            variants = [
-                {
-                    "id": vid,
-                    "artifacts": sorted(set(artifacts))
-                }
-                for vid, artifacts in sorted(variants_map.items(), key=lambda item: item[0])
-            ]
-
-            model_entry: dict = {
-                "id": model_id,
-                "root": str(model_dir.relative_to(MODELS_DIR)),
-                "path": None,
-                "variants": variants,
-                "missing": False,
-                "loaded": model_id in loaded_models
-            }
-
-            for variant in variants:
-                onnx_artifacts = [a for a in variant["artifacts"] if a.endswith(".onnx")]
-                if onnx_artifacts:
-                    model_entry["path"] = onnx_artifacts[0]
-                    break
-
-            models_out.append(model_entry)
+    try:
+        with os.scandir(MODELS_DIR) as it:
+            model_dirs = sorted((entry for entry in it if entry.is_dir()), key=lambda entry: entry.name.lower())
+    except OSError:
+        model_dirs = []
+
+    found_ids = {model_dir.name for model_dir in model_dirs}
+    # One consistent view of the loaded set for every entry of this scan, even
+    # if a load/unload lands while the folders are being walked.
+    loaded = frozenset(loaded_models)
+    if REGISTRY_SCAN_WORKERS > 1 and len(model_dirs) > 1:
+        # Folder walks are independent and mostly waiting on the filesystem,
+        # which adds up on network shares.
+        with ThreadPoolExecutor(max_workers=min(REGISTRY_SCAN_WORKERS, len(model_dirs))) as pool:
+            models_out.extend(pool.map(_scan_model_entry, model_dirs, repeat(loaded)))
+    else:
+        models_out.extend(_scan_model_entry(model_dir, loaded) for model_dir in model_dirs)
 
     for model_id, model in existing_by_id.items():
         if model_id not in found_ids:
@@ -82,6 +205,9 @@ def scan_models_registry() -> dict:
             models_out.append(model)
 
     registry = {"models": models_out}
-    REGISTRY_PATH.write_text(json.dumps(registry, indent=2))
+    payload = orjson.dumps(registry, option=orjson.OPT_INDENT_2)
+    # Leave the file (and its mtime) alone when nothing changed.
+    if payload != previous:
+        REGISTRY_PATH.write_bytes(payload)
     return registry
 
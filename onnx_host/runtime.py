@@ -1,9 +1,41 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+import weakref
+
 import numpy as np
-import onnxruntime as ort
+
+from .config import ORT_EXECUTOR_WORKERS
+
+if TYPE_CHECKING:
+    import onnxruntime as ort
+
+
+# ORT releases the GIL inside session.run, so these threads run inference in
+# parallel with the FastAPI event loop.
+_ORT_EXECUTOR = ThreadPoolExecutor(max_workers=ORT_EXECUTOR_WORKERS, thread_name_prefix="ort")
+
+
+async def run_in_ort_executor(fn, *args):
+    """Run a blocking ONNX Runtime call on the shared ORT executor."""
+    return await asyncio.get_running_loop().run_in_executor(_ORT_EXECUTOR, fn, *args)
+
+
+@lru_cache(maxsize=1)
+def _load_onnxruntime():
+    """Import onnxruntime on first use; it is the slowest import at startup."""
+    import onnxruntime
+
+    return onnxruntime
 
 
 def create_session(model_path: str, providers: list[str] | None = None) -> ort.InferenceSession:
     """Create an ONNX Runtime session with the correct DirectML-friendly flags."""
+    ort = _load_onnxruntime()
     options = ort.SessionOptions()
     # DirectML requirement: Disable memory pattern & use sequential execution
     options.enable_mem_pattern = False
@@ -16,21 +48,104 @@ def create_session(model_path: str, providers: list[str] | None = None) -> ort.I
     )
 
 
-def _dtype_for_input(input_type: str):
-    t = (input_type or "").lower()
-    if "int64" in t:
-        return np.int64
-    if "int32" in t:
-        return np.int32
-    if "int8" in t:
-        return np.int8
-    if "bool" in t:
-        return np.bool_
-    if "float16" in t:
-        return np.float16
-    if "double" in t or "float64" in t:
-        return np.float64
-    return np.float32
+# ORT tensor type string -> numpy dtype, exact matches only. Types numpy has no
+# equivalent for (bfloat16, string, float8...) are left to ORT's own conversion.
+_ORT_TENSOR_DTYPES: dict[str, np.dtype] = {
+    f"tensor({ort_type})": np.dtype(np_type)
+    for ort_type, np_type in (
+        ("float", np.float32),
+        ("float16", np.float16),
+        ("double", np.float64),
+        ("int8", np.int8),
+        ("uint8", np.uint8),
+        ("int16", np.int16),
+        ("uint16", np.uint16),
+        ("int32", np.int32),
+        ("uint32", np.uint32),
+        ("int64", np.int64),
+        ("uint64", np.uint64),
+        ("bool", np.bool_),
+    )
+}
+
+
+def _dtype_for_input(input_type: str) -> np.dtype | None:
+    """numpy dtype for an ORT input type string, or None when there is no exact match."""
+    return _ORT_TENSOR_DTYPES.get(input_type or "")
+
+
+def _smoke_dtype(input_type: str) -> np.dtype:
+    dtype = _dtype_for_input(input_type)
+    return np.dtype(np.float32) if dtype is None else dtype
+
+
+class BoundSession:
+    """
+    Hot-session wrapper that reuses one IOBinding per input signature.
+
+    Outputs are bound once per signature and inputs are rebound in place on each
+    call, so repeated same-shape requests skip rebuilding the run plumbing. A
+    binding that is busy on another thread falls back to a plain session.run.
+    """
+
+    MAX_BINDINGS = 16
+
+    def __init__(self, session: ort.InferenceSession):
+        self.session = session
+        self.input_dtypes = {inp.name: _dtype_for_input(inp.type) for inp in session.get_inputs()}
+        self._output_names = [out.name for out in session.get_outputs()]
+        self._bindings: dict[tuple, tuple[Lock, ort.IOBinding]] = {}
+        self._bindings_lock = Lock()
+
+    def to_feeds(self, input_data: dict) -> dict[str, np.ndarray]:
+        return {
+            name: np.ascontiguousarray(value, dtype=self.input_dtypes.get(name))
+            for name, value in input_data.items()
+        }
+
+    def run(self, input_data: dict) -> list:
+        feeds = self.to_feeds(input_data)
+        key = tuple((name, arr.shape, arr.dtype.str) for name, arr in feeds.items())
+        lock, binding = self._binding_for(key)
+        if not lock.acquire(blocking=False):
+            return self.session.run(None, feeds)
+        try:
+            for name, arr in feeds.items():
+                binding.bind_cpu_input(name, arr)
+            self.session.run_with_iobinding(binding)
+            return binding.copy_outputs_to_cpu()
+        finally:
+            lock.release()
+
+    def _binding_for(self, key: tuple) -> tuple[Lock, ort.IOBinding]:
+        with self._bindings_lock:
+            entry = self._bindings.get(key)
+            if entry is None:
+                if len(self._bindings) >= self.MAX_BINDINGS:
+                    self._bindings.pop(next(iter(self._bindings)))
+                binding = self.session.io_binding()
+                for name in self._output_names:
+                    binding.bind_output(name)
+                entry = (Lock(), binding)
+                self._bindings[key] = entry
+            return entry
+
+
+def _zeros(shared: dict, shape: tuple, dtype) -> np.ndarray:
+    """
+    Read-only zero input, one per (shape, dtype) in `shared`; ORT only reads
+    smoke-test feeds.
+
+    `shared` belongs to a single feed build, so the arrays live in _SMOKE_FEEDS
+    and are freed with their session.
+    """
+    key = (shape, np.dtype(dtype))
+    zeros = shared.get(key)
+    if zeros is None:
+        zeros = np.zeros(shape, dtype=dtype)
+        zeros.flags.writeable = False
+        shared[key] = zeros
+    return zeros
 
 
 def _shape_for_input(shape):
@@ -43,52 +158,94 @@ def _shape_for_input(shape):
     return cooked
 
 
-def smoke_llm(session: ort.InferenceSession) -> None:
+def _input_specs(session: ort.InferenceSession) -> list[tuple[str, list, str]]:
+    """(name, shape, type) per input, each read once from the ORT NodeArg."""
+    return [(inp.name, inp.shape, inp.type) for inp in session.get_inputs()]
+
+
+def _llm_smoke_feeds(session: ort.InferenceSession) -> dict:
     inputs = {}
-    for inp in session.get_inputs():
-        if inp.name == "input_ids":
-            inputs[inp.name] = np.array([[1]], dtype=np.int64)
-        elif inp.name == "attention_mask":
-            inputs[inp.name] = np.array([[1]], dtype=np.int64)
+    shared: dict = {}
+    for name, dims, input_type in _input_specs(session):
+        if name == "input_ids":
+            inputs[name] = np.array([[1]], dtype=np.int64)
+        elif name == "attention_mask":
+            inputs[name] = np.array([[1]], dtype=np.int64)
         else:
-            shape = _shape_for_input(inp.shape)
-            inputs[inp.name] = np.zeros(shape, dtype=_dtype_for_input(inp.type))
-    session.run(None, inputs)
+            shape = _shape_for_input(dims)
+            inputs[name] = _zeros(shared, tuple(shape), _smoke_dtype(input_type))
+    return inputs
 
 
-def smoke_whisper(session: ort.InferenceSession) -> None:
+def _whisper_smoke_feeds(session: ort.InferenceSession) -> dict:
     inputs = {}
-    for inp in session.get_inputs():
-        if inp.name == "input_features":
-            inputs[inp.name] = np.zeros((1, 80, 16), dtype=np.float32)
+    shared: dict = {}
+    for name, dims, input_type in _input_specs(session):
+        if name == "input_features":
+            inputs[name] = _zeros(shared, (1, 80, 16), np.float32)
         else:
-            shape = _shape_for_input(inp.shape)
-            inputs[inp.name] = np.zeros(shape, dtype=_dtype_for_input(inp.type))
-    session.run(None, inputs)
+            shape = _shape_for_input(dims)
+            inputs[name] = _zeros(shared, tuple(shape), _smoke_dtype(input_type))
+    return inputs
 
 
-def smoke_tts(session: ort.InferenceSession) -> None:
+def _tts_smoke_feeds(session: ort.InferenceSession) -> dict:
     inputs = {}
+    shared: dict = {}
     max_len = 64
-    for inp in session.get_inputs():
-        lname = inp.name.lower()
-        if inp.name == "input_ids":
-            inputs[inp.name] = np.array([list(range(1, max_len + 1))], dtype=np.int64)
-        elif inp.name == "style":
-            inputs[inp.name] = np.zeros((1, 256), dtype=np.float32)
-        elif inp.name == "speed":
-            inputs[inp.name] = np.array([1.0], dtype=np.float32)
+    for name, dims, input_type in _input_specs(session):
+        lname = name.lower()
+        if name == "input_ids":
+            inputs[name] = np.arange(1, max_len + 1, dtype=np.int64)[None, :]
+        elif name == "style":
+            inputs[name] = _zeros(shared, (1, 256), np.float32)
+        elif name == "speed":
+            inputs[name] = np.array([1.0], dtype=np.float32)
         elif "length" in lname or lname.endswith("len") or "_len" in lname:
-            inputs[inp.name] = np.array([max_len], dtype=np.int64)
+            inputs[name] = np.array([max_len], dtype=np.int64)
         else:
-            shape = _shape_for_input(inp.shape)
+            shape = _shape_for_input(dims)
             if "style" not in lname:
                 shape = [
                     min(d, max_len) if isinstance(d, int) and d > 0 else max_len
                     for d in shape
                 ]
-            inputs[inp.name] = np.zeros(shape, dtype=_dtype_for_input(inp.type))
-    session.run(None, inputs)
+            inputs[name] = _zeros(shared, tuple(shape), _smoke_dtype(input_type))
+    return inputs
+
+
+_SMOKE_FEED_BUILDERS = {
+    "llm": _llm_smoke_feeds,
+    "asr": _whisper_smoke_feeds,
+    "tts": _tts_smoke_feeds,
+}
+
+# Smoke feeds depend only on the session's input metadata, so repeated smoke
+# calls (warmup, health checks) reuse them. Entries go away with the session.
+_SMOKE_FEEDS: weakref.WeakKeyDictionary[Any, dict[str, dict]] = weakref.WeakKeyDictionary()
+
+
+def _smoke_feeds(session: ort.InferenceSession, kind: str) -> dict:
+    feeds_by_kind = _SMOKE_FEEDS.get(session)
+    if feeds_by_kind is None:
+        feeds_by_kind = _SMOKE_FEEDS.setdefault(session, {})
+    feeds = feeds_by_kind.get(kind)
+    if feeds is None:
+        feeds = _SMOKE_FEED_BUILDERS[kind](session)
+        feeds_by_kind[kind] = feeds
+    return feeds
+
+
+def smoke_llm(session: ort.InferenceSession) -> None:
+    session.run(None, _smoke_feeds(session, "llm"))
+
+
+def smoke_whisper(session: ort.InferenceSession) -> None:
+    session.run(None, _smoke_feeds(session, "asr"))
+
+
+def smoke_tts(session: ort.InferenceSession) -> None:
+    session.run(None, _smoke_feeds(session, "tts"))
 
 
 def run_smoke_test(session: ort.InferenceSession, kind: str) -> None:
@@ -1,10 +1,19 @@
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import HTTPException
 
-from .config import MODELS_DIR
+from .config import MODELS_DIR, path_mtime_ns
 
 
+_SELECTABLES_TTL_SECONDS = 5.0
+# model_id -> (fingerprint, cached_at, selectables, membership sets)
+_selectables_cache: dict[str, tuple[tuple, float, dict, dict]] = {}
+
+
+@lru_cache(maxsize=256)
 def model_kind(model_id: str) -> str:
     lid = model_id.lower()
     if lid.startswith("kokoro"):
@@ -14,22 +23,56 @@ def model_kind(model_id: str) -> str:
     return "llm"
 
 
+def _stem(name: str) -> str:
+    # Path(name).stem without building a Path.
+    dot = name.rfind(".")
+    return name[:dot] if 0 < dot < len(name) - 1 else name
+
+
 def _list_selectables(model_id: str) -> dict:
+    """
+    List selectable voices/configs for a model, cached briefly per model and
+    keyed on the folder mtimes. The returned dict must not be mutated.
+    """
+    return _selectables_entry(model_id)[2]
+
+
+def _selectable_sets(model_id: str) -> dict[str, frozenset[str]]:
+    """Same data as _list_selectables, as frozensets for membership checks."""
+    return _selectables_entry(model_id)[3]
+
+
+def _selectables_entry(model_id: str) -> tuple[tuple, float, dict, dict]:
     model_root = MODELS_DIR / model_id
-    if not model_root.exists():
+    root_mtime = path_mtime_ns(model_root)
+    if root_mtime is None:
+        _selectables_cache.pop(model_id, None)
         raise HTTPException(404, "Model folder missing on disk")
 
+    fingerprint = (
+        root_mtime,
+        path_mtime_ns(model_root / "voices"),
+        path_mtime_ns(model_root / "configs"),
+    )
+    now = time.monotonic()
+    cached = _selectables_cache.get(model_id)
+    if cached is not None and cached[0] == fingerprint and now - cached[1] < _SELECTABLES_TTL_SECONDS:
+        return cached
+
     def list_names(folder: Path) -> list[str]:
-        if not folder.exists() or not folder.is_dir():
+        try:
+            with os.scandir(folder) as it:
+                names = [entry.name for entry in it if entry.is_file()]
+        except OSError:
             return []
-        items = []
-        for entry in folder.iterdir():
-            if entry.is_file():
-                items.append(entry.stem)
-        return sorted(items, key=lambda s: s.lower())
+        return sorted((_stem(name) for name in names), key=str.lower)
 
-    return {
+    selectables = {
         "voices": list_names(model_root / "voices"),
         "configs": list_names(model_root / "configs"),
     }
+    sets = {key: frozenset(names) for key, names in selectables.items()}
+    entry = (fingerprint, now, selectables, sets)
+    _selectables_cache[model_id] = entry
+    return entry
 
@@ -1,4 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 import gc
+from threading import Thread
+
+from .selectors import model_kind
 
 
 class SessionRecord:
@@ -57,8 +61,17 @@ class SessionGroupManager:
         try:
             group.vram_before = self.dxgi.vram_used_bytes()
 
-            for session in group.sessions.values():
-                session.session = self.create_session(session.onnx_path)
+            records = list(group.sessions.values())
+            if records:
+                # The first session brings up the execution provider's device;
+                # the rest are independent and build in parallel.
+                first, rest = records[0], records[1:]
+                first.session = self.create_session(first.onnx_path)
+                if rest:
+                    with ThreadPoolExecutor(max_workers=len(rest)) as pool:
+                        created = pool.map(self.create_session, [record.onnx_path for record in rest])
+                        for record, created_session in zip(rest, created):
+                            record.session = created_session
 
             group.vram_after = self.dxgi.vram_used_bytes()
             group.vram_delta = group.vram_after - group.vram_before
@@ -77,9 +90,16 @@ class SessionGroupManager:
         group.state = "unloaded"
 
     def _teardown_group(self, group: SessionGroup):
+        released = False
         for session in group.sessions.values():
-            session.session = None
-        gc.collect()
+            if session.session is not None:
+                session.session = None
+                released = True
+        if released:
+            # Dropping the last reference already frees ORT's native memory;
+            # the collection only sweeps leftover Python cycles, so it runs off
+            # the caller's thread.
+            Thread(target=gc.collect, name="session-gc", daemon=True).start()
 
     def list_loaded(self):
         return {
@@ -94,7 +114,27 @@ class SessionGroupManager:
 
 # This dictionary keeps the 'Hot' models in VRAM
 hot_models: dict[str, object] = {}
+# The same sessions bucketed by model_kind, so adapters find a loaded ASR/TTS
+# model without classifying every hot model. Mutate both via the helpers below.
+hot_models_by_kind: dict[str, dict[str, object]] = {}
+# Per-model IOBinding-reusing wrappers around hot_models sessions.
+bound_sessions: dict[str, object] = {}
+# Per-model /predict coalescers, only for models with a dynamic batch dimension.
+predict_batchers: dict[str, object] = {}
 
 loaded_models: set[str] = set()
 active_model_options: dict[str, dict[str, str | None]] = {}
 
+
+def set_hot_model(model_id: str, session) -> None:
+    hot_models[model_id] = session
+    hot_models_by_kind.setdefault(model_kind(model_id), {})[model_id] = session
+
+
+def pop_hot_model(model_id: str):
+    session = hot_models.pop(model_id, None)
+    bucket = hot_models_by_kind.get(model_kind(model_id))
+    if bucket is not None:
+        bucket.pop(model_id, None)
+    return session
+
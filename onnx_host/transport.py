@@ -0,0 +1,85 @@
+from contextvars import ContextVar
+from typing import Any
+
+import msgpack
+from fastapi import HTTPException, Request
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers, MutableHeaders
+
+from .responses import OrjsonResponse
+
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Set by MsgpackRoute for the duration of a request whose Accept header asks for
+# MessagePack; NegotiatedResponse reads it when rendering.
+_wants_msgpack: ContextVar[bool] = ContextVar("wants_msgpack", default=False)
+
+
+def _msgpack_default(obj: Any):
+    # NumPy arrays and scalars (predict outputs) become plain lists/numbers.
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Type is not MessagePack serializable: {type(obj).__name__}")
+
+
+class NegotiatedResponse(OrjsonResponse):
+    """
+    JSON by default; MessagePack when the request's `Accept` header asks for it.
+
+    Content is packed straight from Python objects in either case, so there is
+    no JSON round trip on the MessagePack path.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if _wants_msgpack.get():
+            self.media_type = MSGPACK_MEDIA_TYPE
+            return msgpack.packb(content, default=_msgpack_default, use_bin_type=True)
+        return super().render(content)
+
+
+class MsgpackRequest(Request):
+    """Request whose body is decoded from MessagePack instead of JSON."""
+
+    @property
+    def headers(self) -> Headers:
+        # FastAPI only hands bodies with a JSON content type to Request.json();
+        # present one so the decoded object below becomes the handler input.
+        if not hasattr(self, "_headers"):
+            headers = MutableHeaders(scope={"headers": list(self.scope["headers"])})
+            headers["content-type"] = JSON_MEDIA_TYPE
+            self._headers = headers
+        return self._headers
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            try:
+                self._json = msgpack.unpackb(await self.body(), raw=False)
+            except (ValueError, TypeError, msgpack.UnpackException) as e:
+                raise HTTPException(status_code=400, detail="Invalid MessagePack body") from e
+        return self._json
+
+
+class MsgpackRoute(APIRoute):
+    """
+    Route class for the optional MessagePack transport alongside the default JSON one.
+
+    Request bodies sent as `application/msgpack` are decoded directly into the
+    handler input, and responses are rendered as MessagePack by
+    NegotiatedResponse when `Accept` asks for it.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request):
+            if request.headers.get("content-type", "").startswith(MSGPACK_MEDIA_TYPE):
+                request = MsgpackRequest(request.scope, request.receive)
+            token = _wants_msgpack.set(MSGPACK_MEDIA_TYPE in request.headers.get("accept", ""))
+            try:
+                return await handler(request)
+            finally:
+                _wants_msgpack.reset(token)
+
+        return route_handler
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from onnx_host import state
+from onnx_host.audio.adapters import _build_feature_batch, ingest_asr_frame, ingest_asr_frames
+
+
+class _DynamicBatchAsr:
+    """ASR session with a symbolic batch axis and one static output."""
+
+    def __init__(self):
+        self.batch_sizes: list[int] = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input_features", type="tensor(float)", shape=["batch", 80, 16])]
+
+    def get_outputs(self):
+        return [
+            SimpleNamespace(name="logits", shape=["batch", 16, 32]),
+            SimpleNamespace(name="table", shape=[2, 5]),
+        ]
+
+    def run(self, output_names, inputs):
+        features = inputs["input_features"]
+        batch = features.shape[0]
+        self.batch_sizes.append(batch)
+        return [np.zeros((batch, 16, 32), dtype=np.float32), np.zeros((2, 5), dtype=np.float32)]
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = _DynamicBatchAsr()
+    monkeypatch.setitem(state.hot_models_by_kind, "asr", {"asr-model": session})
+    return session
+
+
+def test_batched_ingest_matches_per_frame_ingest(session):
+    rng = np.random.default_rng(0)
+    frames = [rng.standard_normal(4096).astype(np.float32) for _ in range(2)]
+
+    batched = ingest_asr_frames(frames)
+    assert session.batch_sizes == [2]
+
+    single = [ingest_asr_frame(frame) for frame in frames]
+    assert batched == single
+    assert batched[0]["output_shapes"] == [[1, 16, 32], [2, 5]]
+
+
+def test_unequal_frames_fall_back_to_per_frame_runs(session):
+    frames = [np.zeros(4096, dtype=np.float32), np.zeros(2048, dtype=np.float32)]
+
+    results = ingest_asr_frames(frames)
+    assert session.batch_sizes == [1, 1]
+    assert [result["status"] for result in results] == ["ok", "ok"]
+
+
+def test_ingest_without_a_model_reports_each_frame(monkeypatch):
+    monkeypatch.setitem(state.hot_models_by_kind, "asr", {})
+    assert ingest_asr_frames([np.zeros(16, dtype=np.float32)] * 3) == [{"status": "no_model"}] * 3
+
+
+def test_feature_batch_is_a_contiguous_tensor():
+    frames = np.vstack([np.full(3200, 0.5, dtype=np.float32), np.full(3200, -0.25, dtype=np.float32)])
+
+    features = _build_feature_batch(frames, (1, 80, 16))
+    assert features.shape == (2, 80, 16)
+    assert features.flags.c_contiguous and features.flags.writeable
+    np.testing.assert_allclose(features[0], 0.5, rtol=1e-6)
+    np.testing.assert_allclose(features[1], 0.25, rtol=1e-6)
@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+import wave
+
+import numpy as np
+import pytest
+
+from onnx_host.audio import engine as engine_module
+from onnx_host.audio import format as format_module
+from onnx_host.audio.engine import AudioEngine, _RuntimeStream, _SpscFrameRing, _WorkerHandle
+
+
+def test_stop_stream_clears_diagnostics_published_while_draining(monkeypatch):
+    engine = AudioEngine()
+    engine._streams["mic"] = SimpleNamespace(stream_id="mic", active=True)
+    engine._last_asr_adapter_result["mic"] = {"text": "old"}
+
+    def close_runtime(runtime):
+        # A capture worker drains its ring on stop and dispatches the last window.
+        engine._last_asr_adapter_result[runtime.stream_id] = {"text": "drained"}
+
+    monkeypatch.setattr(engine, "_close_runtime_unlocked", close_runtime)
+
+    assert engine.stop_stream("mic") is True
+    assert engine.get_adapter_diagnostics()["asr"] == {}
+
+
+def test_lagging_capture_worker_batches_asr_windows(monkeypatch):
+    calls = []
+
+    def ingest(windows, *, model_id=None):
+        calls.append([window.tolist() for window in windows])
+        return [{"status": "ok", "window": index} for index in range(len(windows))]
+
+    monkeypatch.setattr(engine_module, "ingest_asr_frames", ingest)
+    engine = AudioEngine()
+    route = SimpleNamespace(sink=SimpleNamespace(kind="asr", config={}), processors=[])
+    runtime = _RuntimeStream(
+        stream_id="mic",
+        route=route,
+        sample_rate=16000,
+        channels=1,
+        blocksize=4,
+        backend="test",
+        asr_dispatch_interval=2,
+    )
+    ring = _SpscFrameRing(16, 4)
+    for block in range(6):
+        ring.push(np.full(4, block, dtype=np.float32))
+    worker = _WorkerHandle(thread=None)
+    worker.stop_event.set()
+
+    engine._capture_postproc_worker_loop(
+        runtime=runtime,
+        ring=ring,
+        state_store=SimpleNamespace(publish_meter_levels=lambda *args: None),
+        worker=worker,
+        needs_asr_conversion=True,
+    )
+
+    # Six queued blocks make three two-block windows, handed over in one call.
+    assert calls == [[[0.0] * 4 + [1.0] * 4, [2.0] * 4 + [3.0] * 4, [4.0] * 4 + [5.0] * 4]]
+    assert engine.get_adapter_diagnostics()["asr"] == {"mic": {"status": "ok", "window": 2}}
+
+
+def _write_wav(path, samples: np.ndarray, sample_rate: int) -> None:
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(sample_rate)
+        handle.writeframes((samples * 32767.0).astype(np.int16).tobytes())
+
+
+def _file_input_route(path) -> SimpleNamespace:
+    return SimpleNamespace(
+        route_id="player",
+        source=SimpleNamespace(kind="file_input", name=None, config={"path": str(path)}),
+    )
+
+
+@pytest.mark.parametrize("frames", [1, 2, 441, 4410])
+def test_file_input_playback_resamples_like_resample_poly(tmp_path, monkeypatch, frames):
+    signal = pytest.importorskip("scipy.signal")
+    monkeypatch.setattr(engine_module, "_load_soundfile", lambda: None)
+    tone = np.sin(np.arange(frames) * 0.05).astype(np.float32) * 0.5
+    path = tmp_path / "tone.wav"
+    _write_wav(path, tone, 44100)
+
+    out = AudioEngine()._materialize_playback_signal_unlocked(route=_file_input_route(path), sample_rate=48000)
+
+    pcm = engine_module._read_wav_mono(path)[0]
+    if frames == 1:
+        # resample_poly has no slope to extend a lone sample; it is held instead.
+        assert out.tolist() == [pcm[0]]
+    else:
+        np.testing.assert_array_equal(out, signal.resample_poly(pcm, 160, 147, padtype="line"))
+
+
+def test_file_input_playback_without_scipy_uses_hermite(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine_module, "_load_soundfile", lambda: None)
+    monkeypatch.setattr(format_module, "_load_polyphase", lambda: None)
+    path = tmp_path / "tone.wav"
+    _write_wav(path, np.linspace(-0.5, 0.5, 441, dtype=np.float32), 44100)
+
+    out = AudioEngine()._materialize_playback_signal_unlocked(route=_file_input_route(path), sample_rate=48000)
+
+    pcm = engine_module._read_wav_mono(path)[0]
+    np.testing.assert_array_equal(out, format_module.resample_hermite(pcm, 44100, 48000))
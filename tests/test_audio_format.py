@@ -0,0 +1,40 @@
+import math
+
+import numpy as np
+import pytest
+
+from onnx_host.audio.format import convert_asr_ingress, resample_audio
+
+_RATES = [(48000, 16000), (44100, 16000), (16000, 48000), (22050, 48000), (48000, 44100)]
+
+
+def test_resample_audio_holds_a_single_sample():
+    single = np.array([0.5], dtype=np.float32)
+
+    out = resample_audio(single, 48000, 16000)
+    assert out.dtype == np.float32
+    assert out.tolist() == [0.5]
+    assert resample_audio(single, 16000, 48000).tolist() == [0.5, 0.5, 0.5]
+    assert convert_asr_ingress(single, sample_rate=48000).tolist() == [0.5]
+
+
+@pytest.mark.parametrize("src_rate, dst_rate", _RATES)
+@pytest.mark.parametrize("size", [2, 3, 7, 160, 480, 1023])
+def test_resample_audio_matches_resample_poly(src_rate, dst_rate, size):
+    signal = pytest.importorskip("scipy.signal")
+    samples = np.random.default_rng(size).uniform(-1.0, 1.0, size).astype(np.float32)
+    g = math.gcd(src_rate, dst_rate)
+    expected = signal.resample_poly(samples, dst_rate // g, src_rate // g, padtype="line")
+
+    # Twice: the second call runs on the cached plan.
+    for _ in range(2):
+        out = resample_audio(samples, src_rate, dst_rate)
+        assert out.dtype == np.float32
+        np.testing.assert_array_equal(out, expected)
+
+
+@pytest.mark.parametrize("src_rate, dst_rate", _RATES)
+def test_resample_audio_single_sample_for_every_ratio(src_rate, dst_rate):
+    out = resample_audio(np.array([-0.75], dtype=np.float32), src_rate, dst_rate)
+    assert out.size == max(1, round(dst_rate / src_rate))
+    assert np.all(out == np.float32(-0.75))
@@ -0,0 +1,31 @@
+import pytest
+
+from onnx_host.audio.schemas import AudioNode, AudioRouteRecord
+from onnx_host.audio.state import AudioStateNotFoundError, AudioStateStore
+
+
+def _route(route_id: str) -> AudioRouteRecord:
+    return AudioRouteRecord(
+        route_id=route_id,
+        source=AudioNode(kind="test_tone"),
+        sink=AudioNode(kind="file"),
+    )
+
+
+def test_delete_route_drops_its_stream_lock():
+    store = AudioStateStore(audio_enabled=True)
+    store.upsert_route(_route("r1"))
+    with store.transition("r1", "running"):
+        pass
+    assert "r1" in store._stream_locks
+
+    assert store.delete_route("r1") is True
+    assert "r1" not in store._stream_locks
+
+
+def test_transition_on_unknown_stream_leaves_no_lock():
+    store = AudioStateStore(audio_enabled=True)
+    with pytest.raises(AudioStateNotFoundError):
+        with store.transition("missing", "running"):
+            pass
+    assert store._stream_locks == {}
@@ -0,0 +1,141 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from onnx_host.batching import PredictBatcher
+
+
+class _BlockingBound:
+    """BoundSession stand-in whose run() blocks until released."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def to_feeds(self, input_data: dict) -> dict[str, np.ndarray]:
+        return {name: np.asarray(value, dtype=np.float32) for name, value in input_data.items()}
+
+    def run(self, feeds: dict) -> list:
+        self.started.set()
+        self.release.wait(timeout=5)
+        return [feeds["x"] * 2]
+
+
+def test_close_during_run_fails_in_flight_callers():
+    bound = _BlockingBound()
+
+    async def scenario():
+        batcher = PredictBatcher(bound, max_batch_size=4, max_wait_ms=0)
+        batcher.start()
+        call = asyncio.create_task(batcher.submit({"x": [[1.0, 2.0]]}))
+        await asyncio.get_running_loop().run_in_executor(None, bound.started.wait, 5)
+
+        batcher.close()
+        try:
+            with pytest.raises(RuntimeError, match="Model unloaded"):
+                await asyncio.wait_for(call, timeout=2)
+        finally:
+            bound.release.set()
+
+    asyncio.run(scenario())
+
+
+def test_close_fails_queued_callers():
+    bound = _BlockingBound()
+
+    async def scenario():
+        batcher = PredictBatcher(bound, max_batch_size=1, max_wait_ms=0)
+        batcher.start()
+        first = asyncio.create_task(batcher.submit({"x": [[1.0]]}))
+        await asyncio.get_running_loop().run_in_executor(None, bound.started.wait, 5)
+        second = asyncio.create_task(batcher.submit({"x": [[2.0]]}))
+        await asyncio.sleep(0)
+
+        batcher.close()
+        try:
+            for call in (first, second):
+                with pytest.raises(RuntimeError, match="Model unloaded"):
+                    await asyncio.wait_for(call, timeout=2)
+        finally:
+            bound.release.set()
+
+    asyncio.run(scenario())
+
+
+def test_batches_results_back_to_callers():
+    bound = _BlockingBound()
+    bound.release.set()
+
+    async def scenario():
+        batcher = PredictBatcher(bound, max_batch_size=4, max_wait_ms=20)
+        batcher.start()
+        results = await asyncio.gather(
+            batcher.submit({"x": [[1.0, 2.0]]}),
+            batcher.submit({"x": [[3.0, 4.0]]}),
+        )
+        batcher.close()
+        return results
+
+    first, second = asyncio.run(scenario())
+    assert first[0].tolist() == [[2.0, 4.0]]
+    assert second[0].tolist() == [[6.0, 8.0]]
+
+
+class _RecordingBound:
+    """BoundSession stand-in that returns a per-row output and a static one."""
+
+    def __init__(self):
+        self.runs: list[int] = []
+
+    def to_feeds(self, input_data: dict) -> dict[str, np.ndarray]:
+        return {name: np.asarray(value, dtype=np.float32) for name, value in input_data.items()}
+
+    def run(self, feeds: dict) -> list:
+        x = feeds["x"]
+        self.runs.append(x.shape[0])
+        return [x * 10, np.array([7.0, 8.0], dtype=np.float32)]
+
+
+def test_concurrent_submits_get_their_own_rows():
+    bound = _RecordingBound()
+    requests = [
+        [[1.0, 1.0]],
+        [[2.0, 2.0], [3.0, 3.0], [4.0, 4.0]],
+        [[5.0, 5.0], [6.0, 6.0]],
+    ]
+
+    async def scenario():
+        batcher = PredictBatcher(bound, max_batch_size=8, max_wait_ms=20)
+        batcher.start()
+        try:
+            return await asyncio.gather(*(batcher.submit({"x": rows}) for rows in requests))
+        finally:
+            batcher.close()
+
+    results = asyncio.run(scenario())
+    assert bound.runs == [6]
+    for rows, (per_row, static) in zip(requests, results):
+        assert per_row.tolist() == [[value * 10 for value in row] for row in rows]
+        assert static.tolist() == [7.0, 8.0]
+
+
+def test_submits_with_different_signatures_run_separately():
+    bound = _RecordingBound()
+
+    async def scenario():
+        batcher = PredictBatcher(bound, max_batch_size=8, max_wait_ms=20)
+        batcher.start()
+        try:
+            return await asyncio.gather(
+                batcher.submit({"x": [[1.0, 1.0]]}),
+                batcher.submit({"x": [[2.0, 2.0, 2.0]]}),
+            )
+        finally:
+            batcher.close()
+
+    narrow, wide = asyncio.run(scenario())
+    assert sorted(bound.runs) == [1, 1]
+    assert narrow[0].tolist() == [[10.0, 10.0]]
+    assert wide[0].tolist() == [[20.0, 20.0, 20.0]]
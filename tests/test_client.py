@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from client import AsyncOnnxHostClient, HostClientError, OnnxHostClient
+
+
+def _sync_client(handler) -> OnnxHostClient:
+    client = OnnxHostClient(base_url="http://host")
+    client._http = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def _gated_handler(response: httpx.Response):
+    """Handler that holds every request until released, counting round-trips."""
+    calls = []
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        release.wait(timeout=5)
+        return response
+
+    return handler, calls, release
+
+
+def _concurrent_status(client: OnnxHostClient, calls: list, release: threading.Event, callers: int = 4):
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        futures = [pool.submit(client.status) for _ in range(callers)]
+        # Let the first request reach the transport and the rest queue behind it.
+        while not calls:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        release.set()
+    return futures
+
+
+def test_sync_get_coalesces_concurrent_identical_requests():
+    handler, calls, release = _gated_handler(httpx.Response(200, json={"vram": 1}))
+    client = _sync_client(handler)
+
+    futures = _concurrent_status(client, calls, release)
+    assert [future.result() for future in futures] == [{"vram": 1}] * 4
+    assert calls == ["/status"]
+    assert client._inflight == {}
+
+
+def test_sync_get_shares_a_raised_error():
+    handler, calls, release = _gated_handler(httpx.Response(500, text="boom"))
+    client = _sync_client(handler)
+
+    futures = _concurrent_status(client, calls, release)
+    for future in futures:
+        with pytest.raises(HostClientError, match="boom"):
+            future.result()
+    assert calls == ["/status"]
+
+    # Nothing is cached: the next call goes out again.
+    with pytest.raises(HostClientError):
+        client.status()
+    assert calls == ["/status", "/status"]
+
+
+def _async_client(handler) -> AsyncOnnxHostClient:
+    client = AsyncOnnxHostClient(base_url="http://host")
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_async_get_owner_timeout_does_not_cancel_other_waiters():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.3)
+        return httpx.Response(200, json={"ok": True})
+
+    async def scenario():
+        client = _async_client(handler)
+        owner = asyncio.create_task(asyncio.wait_for(client.status(), 0.05))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(client.status())
+
+        with pytest.raises(asyncio.TimeoutError):
+            await owner
+        assert await waiter == {"ok": True}
+        assert client._inflight == {}
+        await client.close()
+
+    asyncio.run(scenario())
+    assert calls == 1
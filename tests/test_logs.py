@@ -0,0 +1,53 @@
+import logging
+
+import pytest
+
+from onnx_host import logs
+
+
+@pytest.fixture
+def handler():
+    logs.clear_logs()
+    yield logs.InMemoryLogHandler()
+    logs.clear_logs()
+
+
+def _record(level: int, message: str, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("onnx_host.api.engine", level, __file__, 1, message, None, exc_info)
+
+
+def test_recent_logs_expose_only_public_fields(handler):
+    handler.emit(_record(logging.INFO, "loaded"))
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        handler.emit(_record(logging.ERROR, "failed", (type(e), e, e.__traceback__)))
+
+    entries = logs.get_recent_logs()
+    assert [entry["message"] for entry in entries[-2:]] == ["loaded", "failed"]
+    assert set(entries[-2]) == {"timestamp", "level", "logger", "subsystem", "message"}
+    assert set(entries[-1]) == {"timestamp", "level", "logger", "subsystem", "message", "exception"}
+    assert entries[-1]["subsystem"] == "api.engine"
+
+
+def test_recent_logs_do_not_hand_out_buffer_entries(handler):
+    handler.emit(_record(logging.WARNING, "hot"))
+
+    logs.get_recent_logs()[-1]["message"] = "changed"
+    assert logs.get_recent_logs()[-1]["message"] == "hot"
+
+
+def test_min_level_filters_entries(handler):
+    handler.emit(_record(logging.DEBUG, "noise"))
+    handler.emit(_record(logging.WARNING, "signal"))
+
+    assert [entry["message"] for entry in logs.get_recent_logs(min_level="warning")] == ["signal"]
+
+
+def test_recent_logs_survive_a_stale_head(handler, monkeypatch):
+    for message in ("first", "second", "third"):
+        handler.emit(_record(logging.INFO, message))
+
+    # Two racing emits can leave _HEAD behind the newest written slot.
+    monkeypatch.setattr(logs, "_HEAD", logs._HEAD - 2)
+    assert [entry["message"] for entry in logs.get_recent_logs()][-3:] == ["first", "second", "third"]
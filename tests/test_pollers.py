@@ -0,0 +1,25 @@
+import asyncio
+
+from onnx_host import pollers
+
+
+def test_audio_device_poller_follows_the_audio_module(monkeypatch):
+    monkeypatch.setattr(pollers.vram_status_poller, "probe", lambda: {})
+    monkeypatch.setattr(pollers.audio_devices_poller, "probe", lambda: {})
+    monkeypatch.setattr(pollers, "get_audio_module_enabled", lambda: False)
+
+    async def scenario():
+        pollers.start_pollers()
+        try:
+            assert pollers.vram_status_poller._task is not None
+            assert pollers.audio_devices_poller._task is None
+
+            await pollers.set_audio_devices_polling(True)
+            assert pollers.audio_devices_poller._task is not None
+
+            await pollers.set_audio_devices_polling(False)
+            assert pollers.audio_devices_poller._task is None
+        finally:
+            await pollers.stop_pollers()
+
+    asyncio.run(scenario())
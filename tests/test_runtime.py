@@ -0,0 +1,60 @@
+import gc
+import weakref
+from types import SimpleNamespace
+
+import numpy as np
+
+from onnx_host.runtime import BoundSession, _dtype_for_input, _smoke_feeds
+
+
+class _FakeSession:
+    def __init__(self, inputs: dict[str, str]):
+        self._inputs = [SimpleNamespace(name=name, type=input_type, shape=["batch", 4]) for name, input_type in inputs.items()]
+
+    def get_inputs(self):
+        return self._inputs
+
+    def get_outputs(self):
+        return [SimpleNamespace(name="y")]
+
+
+def test_dtype_for_input_matches_exact_tensor_types():
+    assert _dtype_for_input("tensor(uint8)") == np.uint8
+    assert _dtype_for_input("tensor(int8)") == np.int8
+    assert _dtype_for_input("tensor(int16)") == np.int16
+    assert _dtype_for_input("tensor(float)") == np.float32
+    assert _dtype_for_input("tensor(bfloat16)") is None
+    assert _dtype_for_input("tensor(string)") is None
+
+
+def test_to_feeds_keeps_uint8_and_int16_inputs():
+    bound = BoundSession(_FakeSession({"pixels": "tensor(uint8)", "tokens": "tensor(int16)"}))
+
+    feeds = bound.to_feeds({"pixels": [[0, 128, 255, 7]], "tokens": [[1, -2, 3, 300]]})
+
+    assert feeds["pixels"].dtype == np.uint8
+    assert feeds["pixels"].tolist() == [[0, 128, 255, 7]]
+    assert feeds["tokens"].dtype == np.int16
+    assert feeds["tokens"].tolist() == [[1, -2, 3, 300]]
+
+
+def test_to_feeds_leaves_unlisted_types_to_numpy():
+    bound = BoundSession(_FakeSession({"text": "tensor(string)"}))
+
+    feeds = bound.to_feeds({"text": [["a", "b"]]})
+
+    assert feeds["text"].dtype.kind == "U"
+
+
+def test_smoke_feeds_share_zeros_and_free_them_with_the_session():
+    session = _FakeSession({"past_key": "tensor(float)", "past_value": "tensor(float)", "mask": "tensor(int64)"})
+
+    feeds = _smoke_feeds(session, "llm")
+    assert feeds["past_key"] is feeds["past_value"]
+    assert not feeds["past_key"].flags.writeable
+    assert feeds["mask"].dtype == np.int64
+
+    zeros = weakref.ref(feeds["past_key"])
+    del feeds, session
+    gc.collect()
+    assert zeros() is None
@@ -0,0 +1,48 @@
+import msgpack
+import numpy as np
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from onnx_host.transport import MSGPACK_MEDIA_TYPE, MsgpackRoute, NegotiatedResponse
+
+
+class _Payload(BaseModel):
+    name: str
+    values: list[float]
+
+
+def _client() -> TestClient:
+    router = APIRouter(route_class=MsgpackRoute)
+
+    @router.post("/echo")
+    async def echo(payload: _Payload):
+        return NegotiatedResponse({"name": payload.name, "values": np.asarray(payload.values, dtype=np.float32)})
+
+    app = FastAPI(default_response_class=NegotiatedResponse)
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_msgpack_request_and_response():
+    response = _client().post(
+        "/echo",
+        content=msgpack.packb({"name": "a", "values": [1.0, 2.5]}),
+        headers={"Content-Type": MSGPACK_MEDIA_TYPE, "Accept": MSGPACK_MEDIA_TYPE},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert msgpack.unpackb(response.content) == {"name": "a", "values": [1.0, 2.5]}
+
+
+def test_json_stays_the_default():
+    response = _client().post("/echo", json={"name": "a", "values": [1.0]})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"name": "a", "values": [1.0]}
+
+
+def test_invalid_msgpack_body_is_rejected():
+    response = _client().post("/echo", content=b"\xc1", headers={"Content-Type": MSGPACK_MEDIA_TYPE})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid MessagePack body"}